@@ -57,9 +57,12 @@ class RepoAdminTool:
         ``work_root`` may still occur).
     jobs : `int`, optional
         Number of processes to use, when possible.  Defaults to 1.
+    invalidate_find_cache : `bool`, optional
+        If `True`, ignore any exposure-finder results cached in the work
+        directory by previous runs, and scan the filesystem again.
     """
     def __init__(self, repo: RepoDefinition, work_root: Path, dry_run: bool = False,
-                 jobs: int = 1):
+                 jobs: int = 1, invalidate_find_cache: bool = False):
         self.repo = repo
         self.operations = {}
         for parent_operation in self.repo.operations():
@@ -71,10 +74,11 @@ class RepoAdminTool:
         self.progress = Progress("butler-admin")
         self.log = logging.getLogger("butler-admin")
         self.jobs = jobs
+        self.invalidate_find_cache = invalidate_find_cache
 
     @classmethod
     def from_strings(cls, repo: str, site: str, date: str, work_root: str, dry_run: bool = False,
-                     jobs: int = 1) -> RepoAdminTool:
+                     jobs: int = 1, invalidate_find_cache: bool = False) -> RepoAdminTool:
         """Construct a `RepoAdminTool` from the name, site, and date strings
         that identify the repo and the site.
 
@@ -94,13 +98,17 @@ class RepoAdminTool:
             ``work_root`` may still occur).
         jobs : `int`, optional
             Number of processes to use, when possible.  Defaults to 1.
+        invalidate_find_cache : `bool`, optional
+            If `True`, ignore any exposure-finder results cached in the work
+            directory by previous runs.
 
         Returns
         -------
         tool : `RepoAdminTool`
             A new tool instance.
         """
-        return cls(REPOS[repo, date, site], work_root=Path(work_root), dry_run=dry_run, jobs=jobs)
+        return cls(REPOS[repo, date, site], work_root=Path(work_root), dry_run=dry_run, jobs=jobs,
+                   invalidate_find_cache=invalidate_find_cache)
 
     @property
     def site(self) -> SiteDefinition:
@@ -82,8 +82,11 @@ class ConsoleProgressHandler(ProgressHandler):
 @click.option("-j", "--jobs", type=int, default=1)
 @click.option("--status", is_flag=True)
 @click.option("--cleanup", is_flag=True)
+@click.option("--invalidate-find-cache", is_flag=True)
+@click.option("--progress/--no-progress", default=True,
+              help="Show progress bars (default); --no-progress skips progress wrapping entirely.")
 def cli(repo: str, name: str, date: str, site: str, verbose: int, work_root: str, dry_run: bool,
-        jobs: int, status: bool, cleanup: bool):
+        jobs: int, status: bool, cleanup: bool, invalidate_find_cache: bool, progress: bool):
     if dry_run:
         verbose = max(verbose, 1)
     console_level = {0: "WARN", 1: "INFO", 2: "DEBUG"}[verbose]
@@ -107,10 +110,14 @@ def cli(repo: str, name: str, date: str, site: str, verbose: int, work_root: str
     # progress bars.
     python_logger.setLevel({0: logging.INFO, 1: logging.INFO, 2: logging.DEBUG}[verbose])
     python_logger.addHandler(lsst.log.LogHandler())
-    Progress.set_handler(ConsoleProgressHandler())
+    # Progress bars are on by default, even when stdout is not a terminal,
+    # because batch and cron runs rely on them in their captured output;
+    # --no-progress leaves them disabled so hot loops skip wrapping entirely.
+    if progress:
+        Progress.set_handler(ConsoleProgressHandler())
     dry_run = dry_run or status
     tool = RepoAdminTool.from_strings(repo, date=date, site=site, work_root=work_root, dry_run=dry_run,
-                                      jobs=jobs)
+                                      jobs=jobs, invalidate_find_cache=invalidate_find_cache)
     if status:
         assert not cleanup
         tool.status(name)
@@ -32,9 +32,23 @@ __all__ = (
 )
 
 import functools
+import itertools
 import os
 from pathlib import Path
-from typing import AbstractSet, Any, Callable, Iterable, Iterator, Mapping, Optional, Tuple, TYPE_CHECKING
+from typing import (
+    AbstractSet,
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Tuple,
+    TypeVar,
+    TYPE_CHECKING,
+    Union,
+)
 
 from lsst.utils import doImport
 from lsst.daf.butler import (
@@ -56,6 +70,34 @@ if TYPE_CHECKING:
     from lsst.obs.base import Instrument
 
 
+_T = TypeVar("_T")
+
+_PAD = tuple(" " * i for i in range(256))
+"""Precomputed indentation strings for `AdminOperation.print_status`,
+indexed by the number of spaces.
+"""
+
+
+def _chunks(iterable: Iterable[_T], n: int) -> Iterator[List[_T]]:
+    """Iterate over lists of at most ``n`` consecutive elements of an
+    iterable, consuming it lazily.
+    """
+    iterator = iter(iterable)
+    while chunk := list(itertools.islice(iterator, n)):
+        yield chunk
+
+
+@functools.lru_cache(maxsize=None)
+def _existing_uri(uri: str) -> Optional[ButlerURI]:
+    """Return a `ButlerURI` for the given string if it exists, or `None` if it
+    does not.
+
+    Results are cached, so each URI is only parsed and checked once.
+    """
+    result = ButlerURI(uri)
+    return result if result.exists() else None
+
+
 class Group(AdminOperation):
     """An `AdminOperation` that just delegates to a sequence of other
     `AdminOperation`instances, providing structure.
@@ -124,12 +166,12 @@ class Group(AdminOperation):
 
     def print_status(self, tool: RepoAdminTool, indent: int) -> None:
         # Docstring inherited.
-        print(f"{' '*indent}{self.name}:")
+        print(f"{_PAD[indent]}{self.name}:")
         for child in self.children:
             try:
                 child.print_status(tool, indent + 2)
             except OperationNotReadyError as err:
-                print(f"{' '*(indent + 2)}{child.name}: blocked; {err}")
+                print(f"{_PAD[indent + 2]}{child.name}: blocked; {err}")
 
     def run(self, tool: RepoAdminTool) -> None:
         # Docstring inherited.
@@ -148,9 +190,9 @@ class CreateRepo(AdminOperation):
     def print_status(self, tool: RepoAdminTool, indent: int) -> None:
         # Docstring inherited.
         if os.path.exists(os.path.join(tool.root, "butler.yaml")):
-            print(f"{' '*indent}{self.name}: done")
+            print(f"{_PAD[indent]}{self.name}: done")
         else:
-            print(f"{' '*indent}{self.name}: not started")
+            print(f"{_PAD[indent]}{self.name}: not started")
 
     def run(self, tool: RepoAdminTool) -> None:
         # Docstring inherited.
@@ -170,10 +212,7 @@ class CreateRepo(AdminOperation):
         config = Config()
         config[".registry.db"] = tool.site.db_uri_template.format(repo=tool.repo)
         config[".registry.namespace"] = tool.site.db_namespace_template.format(repo=tool.repo)
-        for template in tool.repo.butler_config_templates:
-            uri = ButlerURI(template.format(repo=tool.repo, site=tool.site))
-            if uri.exists():
-                config.update(Config(uri))
+        self._apply_config_templates(tool, config, tool.repo.butler_config_templates)
         return config
 
     def make_dimension_config(self, tool: RepoAdminTool) -> DimensionConfig:
@@ -186,12 +225,29 @@ class CreateRepo(AdminOperation):
             Butler dimension configuration object.
         """
         config = DimensionConfig()
-        for template in tool.repo.dimension_config_templates:
-            uri = ButlerURI(template.format(repo=tool.repo, site=tool.site))
-            if uri.exists():
-                config.update(Config(uri))
+        self._apply_config_templates(tool, config, tool.repo.dimension_config_templates)
         return config
 
+    @staticmethod
+    def _apply_config_templates(tool: RepoAdminTool, config: Config, templates: Iterable[str]) -> None:
+        """Update a configuration object in place with the contents of all
+        override files that exist.
+
+        Parameters
+        ----------
+        tool : `RepoAdminTool`
+            Object managing shared state for all operations.
+        config : `lsst.daf.butler.Config`
+            Configuration object to update.
+        templates : `Iterable` [ `str` ]
+            URI templates to process with `str.format`, as described by
+            `RepoDefinition`.
+        """
+        for template in templates:
+            uri = _existing_uri(template.format(repo=tool.repo, site=tool.site))
+            if uri is not None:
+                config.update(Config(uri))
+
 
 class RegisterInstrument(AdminOperation):
     """A concrete `AdminOperation` that calls `Instrument.register` on a
@@ -224,9 +280,9 @@ class RegisterInstrument(AdminOperation):
         try:
             tool.butler.registry.expandDataId(instrument=self.instrument.getName())
         except LookupError:
-            print(f"{' '*indent}{self.name}: not started")
+            print(f"{_PAD[indent]}{self.name}: not started")
         else:
-            print(f"{' '*indent}{self.name}: done")
+            print(f"{_PAD[indent]}{self.name}: done")
 
     def run(self, tool: RepoAdminTool) -> None:
         # Docstring inherited.
@@ -255,9 +311,9 @@ class RegisterSkyMap(AdminOperation):
         try:
             tool.butler.registry.expandDataId(skymap=self.name)
         except LookupError:
-            print(f"{' '*indent}{self.name}: not started")
+            print(f"{_PAD[indent]}{self.name}: not started")
         else:
-            print(f"{' '*indent}{self.name}: done")
+            print(f"{_PAD[indent]}{self.name}: done")
 
     def run(self, tool: RepoAdminTool) -> None:
         # Docstring inherited.
@@ -285,19 +341,30 @@ class DefineTag(AdminOperation):
     tagged : `str`
         Named of the `~lsst.daf.butler.CollectionType.TAGGED` collection to
         create.
-    query_args : `Iterable`
+    query_args : `Iterable` or `Callable`
         Iterable of ``(*args, **kwargs)`` pairs for
         `lsst.daf.butler.Registry.queryDatasets`, to use to obtain the datasets
-        to associate into ``tagged``.
+        to associate into ``tagged``, or a callable with no arguments that
+        returns such an iterable.  A callable is not invoked until the queries
+        are actually needed.
     doc : `str`
         Documentation string for this collection.
     """
 
-    def __init__(self, name: str, tagged: str, query_args: Iterable[Tuple[tuple, dict]],
-                 doc: str):
+    def __init__(
+        self,
+        name: str,
+        tagged: str,
+        query_args: Union[Iterable[Tuple[tuple, dict]], Callable[[], Iterable[Tuple[tuple, dict]]]],
+        doc: str,
+    ):
         super().__init__(name)
         self.tagged = tagged
-        self._query_args = tuple(query_args)
+        if callable(query_args):
+            self._query_args_factory = query_args
+        else:
+            query_args = tuple(query_args)
+            self._query_args_factory = lambda: query_args
         self.doc = doc
 
     def print_status(self, tool: RepoAdminTool, indent: int) -> None:
@@ -306,20 +373,47 @@ class DefineTag(AdminOperation):
         try:
             refs = set(tool.butler.registry.queryDatasets(..., collections=self.tagged))
         except MissingCollectionError:
-            print(f"{' '*indent}{self.name}: not started")
+            print(f"{_PAD[indent]}{self.name}: not started")
         else:
             if refs == set(self._query(tool)):
-                print(f"{' '*indent}{self.name}: done")
+                print(f"{_PAD[indent]}{self.name}: done")
             else:
-                print(f"{' '*indent}{self.name}: definition changed; run again")
+                print(f"{_PAD[indent]}{self.name}: definition changed; run again")
+
+    ASSOCIATE_N_DATASETS = 10000
+    """Number of datasets to associate into the tagged collection at once.
+
+    Associating everything in one call puts the full set in memory and in a
+    single enormous ``INSERT``, which is a problem for multi-million-dataset
+    collections.
+    """
 
     def run(self, tool: RepoAdminTool) -> None:
         # Docstring inherited.
-        refs = set(self._query(tool))
-        tool.log.info("Found %d datasets to associate into %s.", len(refs), self.tagged)
+        # Different queries can return the same dataset, so we remember the IDs
+        # (not the full refs) of those we've already seen.
+        seen = set()
+        n_refs = 0
+        registered = False
+        for batch in _chunks(self._query(tool), self.ASSOCIATE_N_DATASETS):
+            refs = []
+            for ref in batch:
+                if ref.id not in seen:
+                    seen.add(ref.id)
+                    refs.append(ref)
+            n_refs += len(refs)
+            if not tool.dry_run and refs:
+                # Only register the collection once the query has produced
+                # something, so a query that fails outright leaves nothing
+                # behind.
+                if not registered:
+                    tool.butler.registry.registerCollection(self.tagged, CollectionType.TAGGED)
+                    registered = True
+                tool.butler.registry.associate(self.tagged, refs)
+        tool.log.info("Found %d datasets to associate into %s.", n_refs, self.tagged)
         if not tool.dry_run:
-            tool.butler.registry.registerCollection(self.tagged, CollectionType.TAGGED)
-            tool.butler.registry.associate(self.tagged, refs)
+            if not registered:
+                tool.butler.registry.registerCollection(self.tagged, CollectionType.TAGGED)
             tool.butler.registry.setCollectionDocumentation(self.tagged, self.doc)
 
     def cleanup(self, tool: RepoAdminTool) -> None:
@@ -330,7 +424,8 @@ class DefineTag(AdminOperation):
     def _query(self, tool: RepoAdminTool) -> Iterator[DatasetRef]:
         """Iterate over all datasets to tag,
         """
-        for args, kwargs in tool.progress.wrap(self._query_args, desc=f"Querying for {self.tagged} datasets"):
+        for args, kwargs in tool.progress.wrap(self._query_args_factory(),
+                                               desc=f"Querying for {self.tagged} datasets"):
             yield from tool.butler.registry.queryDatasets(*args, **kwargs)
 
 
@@ -370,19 +465,19 @@ class DefineChain(AdminOperation):
             try:
                 c = set(tool.butler.registry.queryCollections(self.children, flattenChains=self._flatten))
             except MissingCollectionError:
-                print(f"{' '*indent}{self.name}: blocked; some child collections do not exist")
+                print(f"{_PAD[indent]}{self.name}: blocked; some child collections do not exist")
                 return
-            print(f"{' '*indent}{self.name}: ready to run")
+            print(f"{_PAD[indent]}{self.name}: ready to run")
         else:
             try:
                 c = tuple(tool.butler.registry.queryCollections(self.children, flattenChains=self._flatten))
             except MissingCollectionError:
-                print(f"{' '*indent}{self.name}: blocked; some child collections do not exist")
+                print(f"{_PAD[indent]}{self.name}: blocked; some child collections do not exist")
                 return
             if tuple(children) == c:
-                print(f"{' '*indent}{self.name}: done")
+                print(f"{_PAD[indent]}{self.name}: done")
             else:
-                print(f"{' '*indent}{self.name}: definition changed; run again")
+                print(f"{_PAD[indent]}{self.name}: definition changed; run again")
 
     def run(self, tool: RepoAdminTool) -> None:
         # Docstring inherited.
@@ -418,7 +513,7 @@ class IngestFiles(AdminOperation):
         try:
             dataset_type = tool.butler.registry.getDatasetType(self.dataset_type_name)
         except KeyError:
-            print(f"{' '*indent}{self.name}: not started.")
+            print(f"{_PAD[indent]}{self.name}: not started.")
             return
         n_found = 0
         n_total = 0
@@ -430,12 +525,12 @@ class IngestFiles(AdminOperation):
                     n_found += 1
                 n_total += 1
         if n_found == n_total:
-            print(f"{' '*indent}{self.name}: done; {n_total} dataset(s) ingested.")
+            print(f"{_PAD[indent]}{self.name}: done; {n_total} dataset(s) ingested.")
         elif n_found == 0:
-            print(f"{' '*indent}{self.name}: dataset type and collection registered; "
+            print(f"{_PAD[indent]}{self.name}: dataset type and collection registered; "
                   f"{n_total} dataset(s) to ingest.")
         else:
-            print(f"{' '*indent}{self.name}: in progress; {n_found} of {n_total} dataset(s) ingested.")
+            print(f"{_PAD[indent]}{self.name}: in progress; {n_found} of {n_total} dataset(s) ingested.")
 
     def run(self, tool: RepoAdminTool) -> None:
         # Docstring inherited.
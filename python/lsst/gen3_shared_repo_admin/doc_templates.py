@@ -27,6 +27,7 @@ ___all__ = (
     "UMBRELLA",
 )
 
+import functools
 import textwrap
 
 
@@ -36,8 +37,26 @@ class WrappedStringTemplate:
         self._template = template
 
     def format(self, **kwargs: str) -> str:
-        paragraphs = self._template.format(**kwargs).split("\n\n")
-        return "\n\n".join(textwrap.fill(p) for p in paragraphs)
+        return _fill_paragraphs(self._template.format(**kwargs))
+
+
+@functools.lru_cache(maxsize=64)
+def _fill_paragraphs(text: str) -> str:
+    """Wrap each blank-line-separated paragraph in a string.
+
+    Templates are only ever formatted with a few distinct arguments, so we
+    cache the (relatively slow) wrapping on the formatted string.
+    """
+    paragraphs = text.split("\n\n")
+    return "\n\n".join(_WRAPPER.fill(p) for p in paragraphs)
+
+
+_WRAPPER = textwrap.TextWrapper(break_on_hyphens=False)
+"""Text wrapper shared by all templates.
+
+Hyphenated words (e.g. "non-`CALIBRATION`") are never split, which also lets
+the wrapper use its simpler word-splitting regex.
+"""
 
 
 DEFAULT_CALIBS = WrappedStringTemplate("""\
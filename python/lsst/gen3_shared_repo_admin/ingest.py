@@ -29,29 +29,37 @@ __all__ = (
     "IngestLogicError",
     "ListFileExposureIdSource",
     "PatchExistingExposures",
+    "PrefetchFindsGroup",
     "RawIngest",
     "RawIngestGroup",
     "UnstructuredExposureFinder",
 )
 
 from abc import ABC, abstractmethod
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
 import fnmatch
+import functools
 import json
 import logging
 import math
+import operator
 import os
 from pathlib import Path
 import re
 import textwrap
+import types
 from typing import (
     Any,
     Callable,
     Collection,
     Dict,
+    Iterable,
     Iterator,
     List,
+    Mapping,
     Match,
     Optional,
+    Pattern,
     Set,
     Tuple,
     Type,
@@ -65,7 +73,7 @@ from ._operation import AdminOperation, OperationNotReadyError
 from .common import Group
 
 if TYPE_CHECKING:
-    from lsst.daf.butler import ButlerURI, DatasetRef, FileDataset, Progress
+    from lsst.daf.butler import ButlerURI, DatasetRef, FileDataset
     from lsst.obs.base import Instrument, RawIngestTask
     from ._tool import RepoAdminTool
 
@@ -160,8 +168,119 @@ def ingest_raws(
         )
 
 
+@functools.lru_cache(maxsize=256)
+def _glob_matcher(file_pattern: str) -> Callable[[str], Any]:
+    """Return a callable that tests whether a filename matches a shell glob.
+
+    Finders call `ExposureFinder.recursive_glob` once per exposure with the
+    same few patterns, so we cache these rather than translating every time.
+    The most common kind of pattern, ``*`` followed by a literal suffix (e.g.
+    ``*.fits``), is checked with `str.endswith` instead of a regex.
+    """
+    suffix = file_pattern[1:]
+    if file_pattern.startswith("*") and not any(c in suffix for c in "*?["):
+        return operator.methodcaller("endswith", suffix)
+    return re.compile(fnmatch.translate(file_pattern)).match
+
+
+def _scan_directory(
+    path: str,
+    match_name: Callable[[str], Any],
+    follow_symlinks: bool,
+) -> Tuple[List[Tuple[str, Any]], List[str]]:
+    """Scan a single directory for `_walk`.
+
+    Returns the matching files and the subdirectories, as lists so this can
+    be run in a worker thread.  When following symlinks, ``path`` must
+    already be a real path (as are all returned paths).
+    """
+    matches = []
+    subdirs = []
+    with os.scandir(path) as entries:
+        for entry in entries:
+            # is_symlink, is_file and is_dir are usually answered from the
+            # directory entry itself, without another system call; only
+            # following a symlink needs a stat (which DirEntry caches).
+            if entry.is_symlink():
+                if not follow_symlinks:
+                    continue
+                # When following symlinks ``path`` is always a real path,
+                # so only symlinks themselves need resolving.
+                entry_path = os.path.realpath(entry.path)
+            else:
+                entry_path = entry.path
+            if entry.is_file(follow_symlinks=follow_symlinks):
+                if m := match_name(entry.name):
+                    matches.append((entry_path, m))
+            elif entry.is_dir(follow_symlinks=follow_symlinks):
+                subdirs.append(entry_path)
+            # Else case is deliberately ignored; possibilities are entries
+            # that no longer exist (race conditions) and special files.
+    return matches, subdirs
+
+
+def _walk(
+    tool: RepoAdminTool,
+    top: Union[str, Path],
+    match_name: Callable[[str], Any],
+    follow_symlinks: bool,
+) -> Iterator[Tuple[str, Any]]:
+    """Implementation for `ExposureFinder.iter_regex_matches` and
+    `ExposureFinder.recursive_glob`.
+
+    ``match_name`` is called on each filename, and files for which it returns
+    something true are yielded along with that return value.
+
+    Directories are scanned one at a time until more than
+    `ExposureFinder.WALK_PARALLEL_MIN_DIRS` are waiting to be scanned, and
+    only then handed to a thread pool, so small trees (e.g. a single flat
+    directory) never start one.  Progress is always reported from the calling
+    thread.
+    """
+    scan = functools.partial(_scan_directory, match_name=match_name, follow_symlinks=follow_symlinks)
+    top = os.fspath(top) if not follow_symlinks else os.path.realpath(top)
+    # Real paths of directories already queued, so directory symlinks
+    # that point back up the tree can't send us around in circles.
+    visited = {top}
+
+    def unvisited(subdirs: List[str]) -> Iterator[str]:
+        for subdir in subdirs:
+            if follow_symlinks:
+                if subdir in visited:
+                    continue
+                visited.add(subdir)
+            yield subdir
+
+    stack = [top]
+    with tool.progress.at(logging.DEBUG).bar(desc=f"Scanning {top}", total=None) as progress_bar:
+        while stack and len(stack) <= ExposureFinder.WALK_PARALLEL_MIN_DIRS:
+            matches, subdirs = scan(stack.pop())
+            progress_bar.update(1)
+            stack.extend(unvisited(subdirs))
+            yield from matches
+        if not stack:
+            return
+        with ThreadPoolExecutor(max_workers=max(ExposureFinder.WALK_THREADS, tool.jobs)) as executor:
+            pending = {executor.submit(scan, path) for path in stack}
+            try:
+                while pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        matches, subdirs = future.result()
+                        progress_bar.update(1)
+                        pending.update(executor.submit(scan, subdir) for subdir in unvisited(subdirs))
+                        yield from matches
+            finally:
+                # Don't keep scanning if we're bailing out early (because of
+                # an error or because the caller stopped iterating).
+                for future in pending:
+                    future.cancel()
+
+
 class ExposureIdSource(ABC):
 
+    __slots__ = ()
+
     def flatten(self) -> Iterator[AdminOperation]:
         """Recursively iterate over any nested `AdminOperation` instances,
         including ``self`` if appropriate.
@@ -183,7 +302,7 @@ class ListFileExposureIdSource(ExposureIdSource):
     def __init__(self, list_uri: Union[str, ButlerURI, Path]):
         self.list_uri = list_uri
 
-    def exposure_ids(self, tool: RepoAdminTool) -> Dict[int, Path]:
+    def exposure_ids(self, tool: RepoAdminTool) -> Set[int]:
         from lsst.daf.butler import ButlerURI
         return {int(v) for v in ButlerURI(self.list_uri).read().decode().split("\n") if v.strip()}
 
@@ -198,12 +317,32 @@ class ExposureFinder(ExposureIdSource):
     persistent changes to filesystems or databases.
     """
 
+    __slots__ = ()
+
+    WALK_THREADS = 8
+    """Minimum number of threads used to scan directories concurrently in
+    `iter_regex_matches` (and hence `recursive_regex` and `recursive_glob`);
+    more are used if ``tool.jobs`` is larger.
+
+    Recursive scans of networked filesystems are dominated by metadata
+    latency, and `os.scandir` releases the GIL while it waits.
+    """
+
+    WALK_PARALLEL_MIN_DIRS = 4
+    """Number of directories that must be waiting to be scanned before
+    `iter_regex_matches` (and hence `recursive_regex` and `recursive_glob`)
+    starts scanning them concurrently.
+
+    Shallow or narrow trees are scanned faster without the cost of starting
+    `WALK_THREADS` threads.
+    """
+
     def exposure_ids(self, tool: RepoAdminTool) -> Collection[int]:
         # Docstring inherited.
         return self.find(tool).keys()
 
     @abstractmethod
-    def find(self, tool: RepoAdminTool) -> Dict[int, Path]:
+    def find(self, tool: RepoAdminTool) -> Mapping[int, Union[str, Path]]:
         """Find exposures and the root directories that contain all files to
         be ingested for them.
 
@@ -214,15 +353,19 @@ class ExposureFinder(ExposureIdSource):
 
         Returns
         -------
-        exposures : `dict` [ `int`, `Path` ]
-            Dictionary mapping integer exposure ID values to a directory that
-            (not necessarily directly) includes all of the raw files to ingest
-            for that exposure.
+        exposures : `Mapping` [ `int`, `str` or `Path` ]
+            Mapping from integer exposure ID values to a directory that (not
+            necessarily directly) includes all of the raw files to ingest for
+            that exposure.  Callers should not assume the values are `Path`
+            objects (use `os.fspath` or `os.path` functions instead) or that
+            the mapping can be modified.
         """
         raise NotImplementedError()
 
     @abstractmethod
-    def expand(self, tool: RepoAdminTool, exposure_id: int, found: Dict[int, Path]) -> Set[Path]:
+    def expand(
+        self, tool: RepoAdminTool, exposure_id: int, found: Mapping[int, Union[str, Path]]
+    ) -> Collection[Union[str, Path]]:
         """Expand the found path for a directory into a set of paths for its
         raw files.
 
@@ -232,14 +375,16 @@ class ExposureFinder(ExposureIdSource):
             Object managing shared state for all operations.
         exposure_id : `int`
             Integer exposure ID being ingested.
-        found : `dict` [ `int`, `Path` ]
+        found : `Mapping` [ `int`, `str` or `Path` ]
             The dictionary returned by `find`, or a subset of that dictionary
             that is guaranteed to include `exposure_id`.
 
         Returns
         -------
-        raws : `set` [ `Path` ]
-            Paths to raw files.
+        raws : `Collection` [ `str` or `Path` ]
+            Paths to raw files, with no duplicates.  Implementations that scan
+            the filesystem should prefer returning `str` paths, which are
+            cheaper to create.  Files are ingested in the order given.
 
         Notes
         -----
@@ -250,11 +395,41 @@ class ExposureFinder(ExposureIdSource):
         """
         raise NotImplementedError()
 
+    def expand_many(
+        self, tool: RepoAdminTool, exposure_ids: Iterable[int], found: Mapping[int, Union[str, Path]]
+    ) -> Iterator[Tuple[int, Collection[Union[str, Path]]]]:
+        """Expand the found paths for multiple exposures.
+
+        Parameters
+        ----------
+        tool : `RepoAdminTool`
+            Object managing shared state for all operations.
+        exposure_ids : `Iterable` [ `int` ]
+            Integer exposure IDs being ingested.
+        found : `Mapping` [ `int`, `str` or `Path` ]
+            The dictionary returned by `find`, or a subset of that dictionary
+            that is guaranteed to include all of ``exposure_ids``.
+
+        Yields
+        ------
+        exposure_id : `int`
+            Integer exposure ID, in the same order as ``exposure_ids``.
+        raws : `Collection` [ `str` or `Path` ]
+            Paths to raw files, as returned by `expand`.
+
+        Notes
+        -----
+        The default implementation just calls `expand` on each exposure in
+        turn; subclasses may override this to expand exposures concurrently.
+        """
+        for exposure_id in exposure_ids:
+            yield exposure_id, self.expand(tool, exposure_id, found)
+
     @staticmethod
     def recursive_regex(
         tool: RepoAdminTool,
-        top: Path,
-        file_regex: str,
+        top: Union[str, Path],
+        file_regex: Union[str, Pattern],
         follow_symlinks: bool = False,
     ) -> Iterator[Tuple[Path, Match]]:
         """Recursively scan a directory for files whose names (not full paths)
@@ -267,9 +442,9 @@ class ExposureFinder(ExposureIdSource):
         ----------
         tool : `RepoAdminTool`
             Object managing shared state for all operations.
-        top : `Path`
+        top : `str` or `Path`
             Root path to search.
-        file_regex : `str`
+        file_regex : `str` or `re.Pattern`
             Regular expression to match against filenames (including
             extensions, but not including the directory).  For file symlinks,
             this is applied to the symlink, not its target.
@@ -284,28 +459,53 @@ class ExposureFinder(ExposureIdSource):
         match : `Match`
             The regular expression match object.
         """
-        compiled_regex = re.compile(file_regex)
-
-        def recurse_into(path: Path, progress: Progress) -> Iterator[Tuple[Path, Match]]:
-            subdirs = []
-            for entry in progress.wrap(os.scandir(path), desc=f"Scanning {path}"):
-                if entry.is_file(follow_symlinks=follow_symlinks):
-                    if (m := compiled_regex.match(entry.name)) is not None:
-                        yield Path(entry.path if not follow_symlinks else os.path.realpath(entry.path)), m
-                elif entry.is_dir(follow_symlinks=follow_symlinks):
-                    subdirs.append(entry.path if not follow_symlinks else os.path.realpath(entry.path))
-                # Else case is deliberately ignored; possibilities are
-                # entries that no longer exist (race conditions) and
-                # symlinks when follow_symlinks is False.
-            for subdir in progress.wrap(subdirs, desc=f"Descending into subdirectories of {path}"):
-                yield from recurse_into(subdir, progress)
-
-        yield from recurse_into(top, tool.progress.at(logging.DEBUG))
+        for path, m in ExposureFinder.iter_regex_matches(tool, top, file_regex, follow_symlinks):
+            yield Path(path), m
+
+    @staticmethod
+    def iter_regex_matches(
+        tool: RepoAdminTool,
+        top: Union[str, Path],
+        file_regex: Union[str, Pattern],
+        follow_symlinks: bool = False,
+    ) -> Iterator[Tuple[str, Match]]:
+        """Like `recursive_regex`, but yield `str` paths instead of `Path`.
+
+        Callers that scan very many files and only need the paths as strings
+        (or need `Path` objects for only a few of them) should prefer this.
+
+        Parameters
+        ----------
+        tool : `RepoAdminTool`
+            Object managing shared state for all operations.
+        top : `str` or `Path`
+            Root path to search.
+        file_regex : `str` or `re.Pattern`
+            Regular expression to match against filenames; see
+            `recursive_regex`.
+        follow_symlinks : `bool`, optional
+            If `True`, follow directory and file symlinks.  If `False`
+            (default) all symlinks are ignored.
+
+        Yields
+        ------
+        path : `str`
+            Matched paths to files.
+        match : `Match`
+            The regular expression match object.
+
+        Notes
+        -----
+        Directories in wide or deep trees are scanned concurrently (see
+        `WALK_THREADS` and `WALK_PARALLEL_MIN_DIRS`), so matches are grouped
+        by directory but directories are not yielded in any particular order.
+        """
+        yield from _walk(tool, top, re.compile(file_regex).match, follow_symlinks)
 
     @staticmethod
     def recursive_glob(
         tool: RepoAdminTool,
-        top: Path,
+        top: Union[str, Path],
         file_pattern: str,
         follow_symlinks: bool = False,
     ) -> Iterator[Path]:
@@ -319,7 +519,7 @@ class ExposureFinder(ExposureIdSource):
         ----------
         tool : `RepoAdminTool`
             Object managing shared state for all operations.
-        top : `Path`
+        top : `str` or `Path`
             Root path to search.
         file_pattern : `str`
             Glob pattern to match against filenames (including extensions, but
@@ -334,10 +534,8 @@ class ExposureFinder(ExposureIdSource):
         path : `Path`
             Matched paths to files.
         """
-        file_regex = fnmatch.translate(file_pattern)
-        yield from (
-            path for path, _ in ExposureFinder.recursive_regex(tool, top, file_regex, follow_symlinks)
-        )
+        for path, _ in _walk(tool, top, _glob_matcher(file_pattern), follow_symlinks):
+            yield Path(path)
 
     def saved_as(self, name: str) -> ExposureFinder:
         """Return an adapted version of the `ExposureFinder` that saves result
@@ -359,7 +557,8 @@ class ExposureFinder(ExposureIdSource):
         return _SaveFoundExposuresAdapter(name, self)
 
     def filtered_by(
-        self, callback: Callable[[RepoAdminTool, Dict[int, Path]], Dict[int, Path]]
+        self,
+        callback: Callable[[RepoAdminTool, Mapping[int, Union[str, Path]]], Mapping[int, Union[str, Path]]],
     ) -> ExposureFinder:
         """Return an adapted version of the `ExposureFinder` that filters
         results according to a callback function.
@@ -397,25 +596,46 @@ class _SaveFoundExposuresAdapter(AdminOperation, ExposureFinder):
     def __init__(self, name: str, adapted: ExposureFinder):
         super().__init__(name)
         self._adapted = adapted
+        self._find_cache: Optional[Tuple[Tuple[str, int, int], Mapping[int, Path]]] = None
 
     def flatten(self) -> Iterator[AdminOperation]:
         # Docstring inherited.
         yield from self._adapted.flatten()
         yield self
 
-    def find(self, tool: RepoAdminTool) -> Dict[int, Path]:
+    def find(self, tool: RepoAdminTool) -> Mapping[int, Path]:
         # Docstring inherited.
         filename = self._filename(tool)
-        if not filename.exists():
-            raise OperationNotReadyError(f"{self.name} has not yet been run.")
-        with open(self._filename(tool), "r") as stream:
+        try:
+            stat = os.stat(filename)
+        except FileNotFoundError:
+            raise OperationNotReadyError(f"{self.name} has not yet been run.") from None
+        # RawIngest, DefineRawTag, and their status reporting all call this,
+        # so only re-read the file if it has changed.
+        key = (os.fspath(filename), stat.st_mtime_ns, stat.st_size)
+        if self._find_cache is not None and self._find_cache[0] == key:
+            return self._find_cache[1]
+        with open(filename, "r") as stream:
             loaded = json.load(stream)
-        return {int(k): Path(v) for k, v in loaded.items()}
+        # Many exposures usually share a directory; only make one Path for
+        # each.
+        paths = {v: Path(v) for v in set(loaded.values())}
+        result = types.MappingProxyType({int(k): paths[v] for k, v in loaded.items()})
+        self._find_cache = (key, result)
+        return result
 
-    def expand(self, tool: RepoAdminTool, exposure_id: int, found: Dict[int, Path]) -> Set[Path]:
+    def expand(
+        self, tool: RepoAdminTool, exposure_id: int, found: Mapping[int, Union[str, Path]]
+    ) -> Collection[Union[str, Path]]:
         # Docstring inherited.
         return self._adapted.expand(tool, exposure_id, found)
 
+    def expand_many(
+        self, tool: RepoAdminTool, exposure_ids: Iterable[int], found: Mapping[int, Union[str, Path]]
+    ) -> Iterator[Tuple[int, Collection[Union[str, Path]]]]:
+        # Docstring inherited.
+        return self._adapted.expand_many(tool, exposure_ids, found)
+
     def print_status(self, tool: RepoAdminTool, indent: int) -> None:
         # Docstring inherited.
         if self._filename(tool).exists():
@@ -426,9 +646,12 @@ class _SaveFoundExposuresAdapter(AdminOperation, ExposureFinder):
 
     def run(self, tool: RepoAdminTool) -> None:
         # Docstring inherited.
-        found_as_strs = {str(k): str(v) for k, v in self._adapted.find(tool).items()}
+        found_as_strs = {str(k): os.fspath(v) for k, v in self._adapted.find(tool).items()}
+        # Without indentation json can use its C encoder, and encoding to a
+        # single string lets us write it in one call.
+        text = json.dumps(found_as_strs, separators=(",", ":"))
         with open(self._filename(tool), "w") as stream:
-            json.dump(found_as_strs, stream, indent=0)
+            stream.write(text)
 
     def _filename(self, tool: RepoAdminTool) -> Path:
         """Return the name of the file used to save the found exposures.
@@ -464,7 +687,7 @@ class _FilterFoundExposuresAdapter(ExposureFinder):
     def __init__(
         self,
         adapted: ExposureFinder,
-        func: Callable[[RepoAdminTool, Dict[int, Path]], Dict[int, Path]],
+        func: Callable[[RepoAdminTool, Mapping[int, Union[str, Path]]], Mapping[int, Union[str, Path]]],
     ):
         self._adapted = adapted
         self._func = func
@@ -473,15 +696,23 @@ class _FilterFoundExposuresAdapter(ExposureFinder):
         # Docstring inherited.
         yield from self._adapted.flatten()
 
-    def find(self, tool: RepoAdminTool) -> Dict[int, Path]:
+    def find(self, tool: RepoAdminTool) -> Mapping[int, Union[str, Path]]:
         # Docstring inherited.
         found = self._adapted.find(tool)
         return self._func(tool, found)
 
-    def expand(self, tool: RepoAdminTool, exposure_id: int, found: Dict[int, Path]) -> Set[Path]:
+    def expand(
+        self, tool: RepoAdminTool, exposure_id: int, found: Mapping[int, Union[str, Path]]
+    ) -> Collection[Union[str, Path]]:
         # Docstring inherited.
         return self._adapted.expand(tool, exposure_id, found)
 
+    def expand_many(
+        self, tool: RepoAdminTool, exposure_ids: Iterable[int], found: Mapping[int, Union[str, Path]]
+    ) -> Iterator[Tuple[int, Collection[Union[str, Path]]]]:
+        # Docstring inherited.
+        return self._adapted.expand_many(tool, exposure_ids, found)
+
 
 class _ApportionFoundExposuresAdapter(ExposureFinder):
     """Adapter class for `ExposureFinder` that subselects a fixed fraction
@@ -509,7 +740,7 @@ class _ApportionFoundExposuresAdapter(ExposureFinder):
         # Docstring inherited.
         yield from self._adapted.flatten()
 
-    def find(self, tool: RepoAdminTool) -> Dict[int, Path]:
+    def find(self, tool: RepoAdminTool) -> Mapping[int, Union[str, Path]]:
         # Docstring inherited.
         found = self._adapted.find(tool)
         total = len(found)
@@ -518,10 +749,18 @@ class _ApportionFoundExposuresAdapter(ExposureFinder):
         stop = min(start + size, total)
         return {exposure_id: found[exposure_id] for exposure_id in sorted(found.keys())[start:stop]}
 
-    def expand(self, tool: RepoAdminTool, exposure_id: int, found: Dict[int, Path]) -> Set[Path]:
+    def expand(
+        self, tool: RepoAdminTool, exposure_id: int, found: Mapping[int, Union[str, Path]]
+    ) -> Collection[Union[str, Path]]:
         # Docstring inherited.
         return self._adapted.expand(tool, exposure_id, found)
 
+    def expand_many(
+        self, tool: RepoAdminTool, exposure_ids: Iterable[int], found: Mapping[int, Union[str, Path]]
+    ) -> Iterator[Tuple[int, Collection[Union[str, Path]]]]:
+        # Docstring inherited.
+        return self._adapted.expand_many(tool, exposure_ids, found)
+
 
 class IngestLogicError(Exception):
     """Exception raised when the information reported by `RawIngestTask` on
@@ -544,9 +783,8 @@ class _CheckRawIngestSuccess:
         ingested_paths = set()
         ingested_exposure_ids = set()
         for fd in fds:
-            ingested_paths.add(Path(fd.path))
-            for ref in fd.refs:
-                ingested_exposure_ids.update(ref.dataId["exposure"] for ref in fd.refs)
+            ingested_paths.add(os.path.normpath(fd.path))
+            ingested_exposure_ids.update(ref.dataId["exposure"] for ref in fd.refs)
         if ingested_paths != self.paths:
             raise IngestLogicError(
                 f"Mismatch between ingested path(s) {ingested_paths - self.paths} "
@@ -560,7 +798,7 @@ class _CheckRawIngestSuccess:
                 f"actually ingested as {bad}: {ingested_paths}."
             )
 
-    paths: Set[Path]
+    paths: Set[str]
     exposure_id: int
 
 
@@ -605,6 +843,84 @@ class RawIngestGroup(Group):
         )
 
 
+class PrefetchFindsGroup(Group):
+    """A `Group` that makes the results of several finders available
+    concurrently before running its children.
+
+    Finders returned by `ExposureFinder.saved_as` (or attached to a
+    `RawIngest` by `RawIngest.save_found`) are prefetched by running their
+    saved-find operations, so the children can read what they saved.  Other
+    finders just have `~ExposureFinder.find` called on them, which only helps
+    for finders that cache their own results (such as
+    `instruments.dc2.ImSimExposureFinder`).  Either way, scans of independent
+    filesystem trees overlap instead of happening one after another.
+
+    Prefetching happens only in `run`, not `print_status`, and skips finders
+    whose results have already been saved, either by the finder itself or by
+    a saved-find operation among the children that wraps it.
+
+    Parameters
+    ----------
+    name : `str`
+        Name of the operation.  Should include any parent-operation prefixes
+        (see `AdminOperation` documentation).
+    children : `Iterable` [ `AdminOperation` ]
+        Child operation instances.
+    finders : `Iterable` [ `ExposureFinder` ]
+        Finders to prefetch.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        children: Iterable[AdminOperation],
+        finders: Iterable[ExposureFinder],
+    ):
+        super().__init__(name, children)
+        self.finders = tuple(finders)
+
+    def run(self, tool: RepoAdminTool) -> None:
+        # Docstring inherited.
+        self.prefetch(tool)
+        super().run(tool)
+
+    def prefetch(self, tool: RepoAdminTool) -> None:
+        """Prefetch the results of all finders whose results have not already
+        been saved.
+
+        At most ``tool.jobs`` finders are run at once, and nothing is done
+        unless at least two can be.
+
+        Parameters
+        ----------
+        tool : `RepoAdminTool`
+            Object managing shared state for all operations.
+        """
+        saved = {
+            op._adapted: op for child in self.children for op in child.flatten()
+            if isinstance(op, _SaveFoundExposuresAdapter)
+        }
+        todo = []
+        for finder in self.finders:
+            if isinstance(finder, _SaveFoundExposuresAdapter):
+                if not finder._filename(tool).exists():
+                    todo.append(finder.run)
+            elif finder not in saved or not saved[finder]._filename(tool).exists():
+                todo.append(finder.find)
+        # Finders may use threads of their own to scan, so overall
+        # concurrency is kept within what --jobs asks for.
+        n_threads = min(len(todo), tool.jobs)
+        if n_threads < 2:
+            return
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            futures = [executor.submit(func, tool) for func in todo]
+            # Wait for all scans before re-raising the first failure, so we
+            # never leave work running in the background.
+            wait(futures)
+            for future in futures:
+                future.result()
+
+
 class RawIngest(AdminOperation):
     """A concrete `AdminOperation` that ingests raw images via
     `lsst.obs.base.RawIngestTask`.
@@ -748,18 +1064,23 @@ class RawIngest(AdminOperation):
         if not found:
             return
         checker = _CheckRawIngestSuccess()
+        # Expand exposures in sorted ID order, so finders can rely on
+        # consecutive exposures (usually in the same directory) being
+        # expanded one after another.
         if not self.extend_ingested_exposures:
             ingested = self.already_ingested(tool)
-            todo = found.keys() - ingested
+            todo = sorted(found.keys() - ingested)
             task = self.make_task(tool, on_success=checker)
         else:
-            todo = found
+            todo = sorted(found.keys())
             task = self.make_task(tool)
-        for exposure_id in tool.progress.wrap(todo, desc="Ingesting exposures"):
-            paths = self.finder.expand(tool, exposure_id, found)
-            checker.paths = paths
-            checker.exposure_id = exposure_id
+        for exposure_id, paths in tool.progress.wrap(self.finder.expand_many(tool, todo, found),
+                                                     total=len(todo), desc="Ingesting exposures"):
             str_paths = [str(p) for p in paths]
+            # Compare paths as normalized strings, since the task may not
+            # hand them back exactly as we passed them in.
+            checker.paths = {os.path.normpath(p) for p in str_paths}
+            checker.exposure_id = exposure_id
             try:
                 if tool.dry_run:
                     # Need a for loop to invoke returned lazy iterator.
@@ -861,12 +1182,13 @@ class DefineRawTag(AdminOperation):
         self.output_collection = output_collection
         self.doc = doc
 
-    QUERY_N_EXPOSURES = 100
+    QUERY_N_EXPOSURES = 500
     """Number of exposures to query for at once.
 
     We can't query for them all at once because we have to stuff them into
     one ``WHERE exposure IN (a, b, c, d, ...)`` expression, but querying
-    one exposure at a time is latency-limited.
+    one exposure at a time is latency-limited.  This is kept below SQLite's
+    traditional limit of 999 bound parameters per statement.
     """
 
     def flatten(self) -> Iterator[AdminOperation]:
@@ -932,7 +1254,7 @@ class DefineRawTag(AdminOperation):
             for n in range(0, len(found), self.QUERY_N_EXPOSURES):
                 start = n
                 stop = min(n + self.QUERY_N_EXPOSURES, len(found))
-                where = "exposure IN (" + ", ".join(str(id) for id in found[start:stop]) + ")"
+                where = "exposure IN (" + ", ".join(map(str, found[start:stop])) + ")"
                 refs.update(
                     tool.butler.registry.queryDatasets(
                         "raw",
@@ -956,7 +1278,7 @@ class UnstructuredExposureFinder(ExposureFinder):
     root : `str`
         Root path to search; subdirectories are searched recursively for
         matching files.
-    file_regex : `str`
+    file_regex : `str` or `re.Pattern`
         Regular expression that raw files must match.  This is compared to the
         filename only, and to file symlink names, not their targets, when
         ``follow_symlinks`` is `True`.
@@ -976,10 +1298,12 @@ class UnstructuredExposureFinder(ExposureFinder):
     also need to reimplement the new `extract_exposure_id` method.
     """
 
+    __slots__ = ("_root", "_file_regex", "_resolve_duplicates", "_follow_symlinks")
+
     def __init__(
         self,
         root: Path,
-        file_regex: str,
+        file_regex: Union[str, Pattern],
         *,
         resolve_duplicates: Optional[Callable[[Path, Path], Optional[Path]]] = None,
         follow_symlinks: bool = False,
@@ -1008,20 +1332,27 @@ class UnstructuredExposureFinder(ExposureFinder):
         """
         raise NotImplementedError()
 
-    def find(self, tool: RepoAdminTool) -> Dict[int, Path]:
+    def find(self, tool: RepoAdminTool) -> Dict[int, str]:
         # Docstring inherited.
-        result = {}
-        for path, match in self.recursive_regex(
+        # Work with string paths from the walker, and only make `Path` objects
+        # for duplicate resolution.
+        result: Dict[int, str] = {}
+        # This loop runs once per matched file, so bind what it calls to
+        # locals.
+        extract_exposure_id = self.extract_exposure_id
+        dirname = os.path.dirname
+        setdefault = result.setdefault
+        for path, match in self.iter_regex_matches(
             tool, self._root, self._file_regex, follow_symlinks=self._follow_symlinks
         ):
-            exposure_id = self.extract_exposure_id(tool, match)
-            previous_path = result.setdefault(exposure_id, path.parent)
-            if previous_path != path.parent:
-                if (best_path := self._resolve_duplicates(previous_path, path.parent)) is not None:
-                    result[exposure_id] = best_path
+            exposure_id = extract_exposure_id(tool, match)
+            parent = dirname(path)
+            if (previous_path := setdefault(exposure_id, parent)) != parent:
+                if (best_path := self._resolve_duplicates(Path(previous_path), Path(parent))) is not None:
+                    result[exposure_id] = os.fspath(best_path)
                 else:
                     raise RuntimeError(
-                        f"Found multiple directory paths ({previous_path}, {path.parent}) "
+                        f"Found multiple directory paths ({previous_path}, {parent}) "
                         f"for exposure {exposure_id}."
                     )
         return result
@@ -33,18 +33,24 @@ __all__ = (
     "UnstructuredImSimExposureFinder",
 )
 
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+import fnmatch
 import functools
-import itertools
+import hashlib
+import json
 import os
 from pathlib import Path
-from typing import Dict, Iterator, Set, TYPE_CHECKING
+import re
+import time
+import types
+from typing import Dict, Iterable, Iterator, List, Mapping, Optional, Set, Tuple, TYPE_CHECKING, Union
 
 from ..common import DefineChain, Group
 from .. import ingest
 from ..refcats import RefCatIngest
 
 if TYPE_CHECKING:
-    import re
     from .._operation import AdminOperation
     from .._tool import RepoAdminTool
 
@@ -54,7 +60,8 @@ class ImSimExposureFinder(ingest.ExposureFinder):
     organized into per-exposure directories.
 
     This finder does not check that all found exposures are complete.  Symbolic
-    links are always followed.
+    links are always followed.  Entries in the root directory whose names are
+    not integers are ignored.
 
     Parameters
     ----------
@@ -64,24 +71,226 @@ class ImSimExposureFinder(ingest.ExposureFinder):
         subdirectory name).
     file_pattern : `str`
         Glob pattern that raw files must match.
+    cache_on_disk : `bool`, optional
+        If `True` (`False` is default), save the exposure directories found
+        in the work directory and reuse them in later runs while the root
+        directory itself is unchanged (see `_scan_or_load`).  Only the root
+        listing is cached; `expand` always lists the exposure directories
+        afresh, so files added to or removed from them are always seen.
+        Pass ``--invalidate-find-cache`` on the command line to force a new
+        scan anyway.
     """
 
-    def __init__(self, root: Path, file_pattern: str):
-        self._root = root
+    __slots__ = ("_root", "_file_pattern", "_file_regex", "_cache_on_disk", "_find_cache")
+
+    def __init__(self, root: Path, file_pattern: str, cache_on_disk: bool = False):
+        # The root is only ever handed to os.scandir, so keep it as a string.
+        self._root = os.fspath(root)
         self._file_pattern = file_pattern
+        self._file_regex = re.compile(fnmatch.translate(file_pattern))
+        self._cache_on_disk = cache_on_disk
+        self._find_cache: Optional[Mapping[int, str]] = None
 
-    def find(self, tool: RepoAdminTool) -> Dict[int, Path]:
+    def find(self, tool: RepoAdminTool) -> Mapping[int, str]:
         # Docstring inherited.
+        # The same finder is often shared by several operations (e.g. ingest
+        # and tagging), so we only scan the root directory once.
+        if self._find_cache is not None:
+            return self._find_cache
+        result = self._scan_or_load(tool) if self._cache_on_disk else self._scan(tool)
+        # The result is shared by every operation (and expand_many thread)
+        # that uses this finder, so don't let any of them modify it.
+        self._find_cache = types.MappingProxyType(result)
+        return self._find_cache
+
+    RACY_MTIME_NS = 2_000_000_000
+    """Minimum age (in nanoseconds) of the root directory's last modification
+    for a scan to be saved by `_scan_or_load`.
+
+    A change made within the filesystem's timestamp granularity of the one
+    we scanned may not change the recorded modification time, so scans of a
+    recently modified root are not trusted beyond the current process.  Two
+    seconds covers the coarsest (NFS and FAT) timestamps.
+    """
+
+    def _scan_or_load(self, tool: RepoAdminTool) -> Dict[int, str]:
+        """Return the result of a previous `_scan` saved in the work directory
+        if it is still valid, or call `_scan` and save its result.
+
+        A saved result is valid if the root directory's device, inode,
+        modification time, and status-change time are all unchanged.  Adding,
+        removing, or renaming an entry in the root changes both times, and
+        unlike the modification time the status-change time cannot be set
+        back by hand.  Nothing is written in dry-run mode.
+
+        Parameters
+        ----------
+        tool : `RepoAdminTool`
+            Object managing shared state for all operations.
+
+        Returns
+        -------
+        exposures : `dict` [ `int`, `str` ]
+            Dictionary mapping exposure ID to exposure directory.
+        """
+        key = self._disk_cache_key()
+        filename = self._disk_cache_filename(tool)
+        if not tool.invalidate_find_cache and filename.exists():
+            with open(filename, "r") as stream:
+                cached = json.load(stream)
+            if cached["root"] == self._root and cached.get("key") == key:
+                return {int(k): v for k, v in cached["found"].items()}
+        start = time.time_ns()
+        result = self._scan(tool)
+        # Only save the result if the root did not change while we were
+        # scanning it and was last changed well before we started.
+        if not tool.dry_run and self._disk_cache_key() == key and start - key[2] >= self.RACY_MTIME_NS:
+            tmp_filename = filename.with_suffix(".tmp")
+            with open(tmp_filename, "w") as stream:
+                json.dump({"root": self._root, "key": key, "found": result}, stream, separators=(",", ":"))
+            os.replace(tmp_filename, filename)
+        return result
+
+    def _disk_cache_key(self) -> List[int]:
+        """Return the root directory status values that `_scan_or_load` uses
+        to decide whether a saved scan is still valid.
+
+        Returns
+        -------
+        key : `list` [ `int` ]
+            Device, inode, modification time and status-change time (in
+            nanoseconds) of the root directory, as a `list` so it compares
+            equal to its own JSON round trip.
+        """
+        stat = os.stat(self._root)
+        return [stat.st_dev, stat.st_ino, stat.st_mtime_ns, stat.st_ctime_ns]
+
+    def _scan(self, tool: RepoAdminTool) -> Dict[int, str]:
+        """Scan the root directory for exposure directories.
+
+        Parameters
+        ----------
+        tool : `RepoAdminTool`
+            Object managing shared state for all operations.
+
+        Returns
+        -------
+        exposures : `dict` [ `int`, `str` ]
+            Dictionary mapping exposure ID to exposure directory.
+        """
         result = {}
-        for entry in tool.progress.wrap(os.scandir(self._root), desc=f"Scanning {self._root}"):
-            if entry.is_dir(follow_symlinks=True):
-                result[int(entry.name)] = entry.path
+        with os.scandir(self._root) as scanner:
+            entries = scanner
+            # Wrapping adds a generator layer for every entry, which is worth
+            # avoiding in this loop when there's no progress bar to update.
+            if tool.progress.is_enabled():
+                entries = tool.progress.wrap(scanner, desc=f"Scanning {self._root}")
+            for entry in entries:
+                # Checking the name first is free, while is_dir may need to
+                # stat a symlink target.
+                try:
+                    exposure_id = int(entry.name)
+                except ValueError:
+                    continue
+                # The entry's own type comes from the directory listing, so
+                # only symlinks need their target stat'd.
+                if entry.is_dir(follow_symlinks=False) or (
+                    entry.is_symlink() and os.path.isdir(entry.path)
+                ):
+                    result[exposure_id] = entry.path
         return result
 
-    def expand(self, tool: RepoAdminTool, exposure_id: int, found: Dict[int, Path]) -> Set[Path]:
+    def _disk_cache_filename(self, tool: RepoAdminTool) -> Path:
+        """Return the name of the file used to cache `find` results between
+        runs.
+
+        Parameters
+        ----------
+        tool : `RepoAdminTool`
+            Object managing shared state for all operations.
+
+        Returns
+        -------
+        filename : `Path`
+            Name of the cache file, unique to this finder's root.
+        """
+        key = hashlib.blake2b(self._root.encode(), digest_size=8).hexdigest()
+        return tool.work_dir.joinpath(f"imsim-find-{key}.json")
+
+    SCAN_THREADS = 16
+    """Minimum number of threads used to scan exposure directories
+    concurrently in `expand_many`; more are used if ``tool.jobs`` is larger.
+
+    Scanning is dominated by filesystem latency, not CPU, so threads help even
+    though they share the GIL.
+    """
+
+    def expand(
+        self, tool: RepoAdminTool, exposure_id: int, found: Mapping[int, Union[str, Path]]
+    ) -> Set[str]:
         # Docstring inherited.
         path = found[exposure_id]
-        return set(self.recursive_glob(tool, path, self._file_pattern, follow_symlinks=True))
+        return set(_scandir_glob(path, self._file_regex))
+
+    def expand_many(
+        self, tool: RepoAdminTool, exposure_ids: Iterable[int], found: Mapping[int, Union[str, Path]]
+    ) -> Iterator[Tuple[int, Set[str]]]:
+        # Docstring inherited.
+        # Only keep a bounded number of scans in flight, so we don't hold the
+        # paths for every exposure in memory at once.
+        n_threads = max(self.SCAN_THREADS, tool.jobs)
+        with ThreadPoolExecutor(max_workers=n_threads) as executor:
+            pending = deque()
+            for exposure_id in exposure_ids:
+                pending.append((exposure_id, executor.submit(self.expand, tool, exposure_id, found)))
+                if len(pending) >= 2*n_threads:
+                    exposure_id, future = pending.popleft()
+                    yield exposure_id, future.result()
+            while pending:
+                exposure_id, future = pending.popleft()
+                yield exposure_id, future.result()
+
+
+def _scandir_glob(root: Union[str, Path], file_regex: re.Pattern) -> Iterator[str]:
+    """Recursively scan a directory for files whose names match a regular
+    expression, following symlinks.
+
+    This is a leaner version of `ingest.ExposureFinder.recursive_glob` (with
+    ``follow_symlinks=True``) for scanning many small per-exposure
+    directories: it walks with an explicit stack and does no per-directory
+    progress reporting.
+
+    Parameters
+    ----------
+    root : `str` or `Path`
+        Root path to search.
+    file_regex : `re.Pattern`
+        Compiled regular expression (usually from `fnmatch.translate`) to
+        match against filenames (not full paths).  For file symlinks, this is
+        applied to the symlink, not its target.
+
+    Yields
+    ------
+    path : `str`
+        Resolved (symlink-free) paths to matching files.
+    """
+    # Directories go on the stack already resolved, so only entries that are
+    # themselves symlinks need os.path.realpath (which lstats every component
+    # of the path it is given).  Remembering the resolved directories we've
+    # seen keeps symlink cycles from sending us around forever.
+    stack = [os.path.realpath(root)]
+    visited = set(stack)
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    if file_regex.match(entry.name):
+                        yield os.path.realpath(entry.path) if entry.is_symlink() else entry.path
+                elif entry.is_dir():
+                    path = os.path.realpath(entry.path) if entry.is_symlink() else entry.path
+                    if path not in visited:
+                        visited.add(path)
+                        stack.append(path)
 
 
 class UnstructuredImSimExposureFinder(ingest.UnstructuredExposureFinder):
@@ -104,6 +313,8 @@ class UnstructuredImSimExposureFinder(ingest.UnstructuredExposureFinder):
         `ingest.UnstructuredExposureFinder`.
     """
 
+    __slots__ = ("_allow_incomplete", "_has_band_suffix")
+
     def __init__(self, root: Path, *, has_band_suffix: bool, allow_incomplete: bool = False):
         super().__init__(
             root,
@@ -112,59 +323,88 @@ class UnstructuredImSimExposureFinder(ingest.UnstructuredExposureFinder):
         self._allow_incomplete = allow_incomplete
         self._has_band_suffix = has_band_suffix
 
-    FILE_REGEX_BAND_SUFFIX = r"lsst_a_(\d+)_R\d{2}_S\d{2}_[ugrizy].fits"
+    FILE_REGEX_BAND_SUFFIX = re.compile(r"lsst_a_(\d+)_R\d{2}_S\d{2}_[ugrizy]\.fits$", re.ASCII)
 
-    FILE_REGEX_NO_BAND_SUFFIX = r"lsst_a_(\d+)_R\d{2}_S\d{2}.fits"
+    FILE_REGEX_NO_BAND_SUFFIX = re.compile(r"lsst_a_(\d+)_R\d{2}_S\d{2}\.fits$", re.ASCII)
 
-    DETECTOR_NAMES = set(
-        f"{r}_{s}" for r, s in itertools.product(
-            (
-                f"R{i}{j}" for i, j in itertools.product(range(5), range(5))
-                if (i, j) not in set(itertools.product([0, 4], [0, 4]))
-            ),
-            (
-                f"S{i}{j}" for i, j in itertools.product(range(3), range(3))
-            ),
-        )
+    DETECTOR_NAMES = (
+        "R01_S00", "R01_S01", "R01_S02", "R01_S10", "R01_S11", "R01_S12", "R01_S20", "R01_S21", "R01_S22",
+        "R02_S00", "R02_S01", "R02_S02", "R02_S10", "R02_S11", "R02_S12", "R02_S20", "R02_S21", "R02_S22",
+        "R03_S00", "R03_S01", "R03_S02", "R03_S10", "R03_S11", "R03_S12", "R03_S20", "R03_S21", "R03_S22",
+        "R10_S00", "R10_S01", "R10_S02", "R10_S10", "R10_S11", "R10_S12", "R10_S20", "R10_S21", "R10_S22",
+        "R11_S00", "R11_S01", "R11_S02", "R11_S10", "R11_S11", "R11_S12", "R11_S20", "R11_S21", "R11_S22",
+        "R12_S00", "R12_S01", "R12_S02", "R12_S10", "R12_S11", "R12_S12", "R12_S20", "R12_S21", "R12_S22",
+        "R13_S00", "R13_S01", "R13_S02", "R13_S10", "R13_S11", "R13_S12", "R13_S20", "R13_S21", "R13_S22",
+        "R14_S00", "R14_S01", "R14_S02", "R14_S10", "R14_S11", "R14_S12", "R14_S20", "R14_S21", "R14_S22",
+        "R20_S00", "R20_S01", "R20_S02", "R20_S10", "R20_S11", "R20_S12", "R20_S20", "R20_S21", "R20_S22",
+        "R21_S00", "R21_S01", "R21_S02", "R21_S10", "R21_S11", "R21_S12", "R21_S20", "R21_S21", "R21_S22",
+        "R22_S00", "R22_S01", "R22_S02", "R22_S10", "R22_S11", "R22_S12", "R22_S20", "R22_S21", "R22_S22",
+        "R23_S00", "R23_S01", "R23_S02", "R23_S10", "R23_S11", "R23_S12", "R23_S20", "R23_S21", "R23_S22",
+        "R24_S00", "R24_S01", "R24_S02", "R24_S10", "R24_S11", "R24_S12", "R24_S20", "R24_S21", "R24_S22",
+        "R30_S00", "R30_S01", "R30_S02", "R30_S10", "R30_S11", "R30_S12", "R30_S20", "R30_S21", "R30_S22",
+        "R31_S00", "R31_S01", "R31_S02", "R31_S10", "R31_S11", "R31_S12", "R31_S20", "R31_S21", "R31_S22",
+        "R32_S00", "R32_S01", "R32_S02", "R32_S10", "R32_S11", "R32_S12", "R32_S20", "R32_S21", "R32_S22",
+        "R33_S00", "R33_S01", "R33_S02", "R33_S10", "R33_S11", "R33_S12", "R33_S20", "R33_S21", "R33_S22",
+        "R34_S00", "R34_S01", "R34_S02", "R34_S10", "R34_S11", "R34_S12", "R34_S20", "R34_S21", "R34_S22",
+        "R41_S00", "R41_S01", "R41_S02", "R41_S10", "R41_S11", "R41_S12", "R41_S20", "R41_S21", "R41_S22",
+        "R42_S00", "R42_S01", "R42_S02", "R42_S10", "R42_S11", "R42_S12", "R42_S20", "R42_S21", "R42_S22",
+        "R43_S00", "R43_S01", "R43_S02", "R43_S10", "R43_S11", "R43_S12", "R43_S20", "R43_S21", "R43_S22",
     )
-    """Rxy_Sxy detector names for the 189 LSSTCam science sensors."""
+    """Rxy_Sxy detector names for the 189 LSSTCam science sensors, in order.
+
+    This is every sensor in every raft of the 5x5 grid except the four corner
+    (wavefront/guider) rafts.
+    """
 
     def extract_exposure_id(self, tool: RepoAdminTool, match: re.Match) -> int:
         # Docstring inherited.
         return int(match.group(1))
 
-    def expand(self, tool: RepoAdminTool, exposure_id: int, found: Dict[int, Path]) -> Set[Path]:
+    def expand(
+        self, tool: RepoAdminTool, exposure_id: int, found: Mapping[int, Union[str, Path]]
+    ) -> List[str]:
         # Docstring inherited.
-        base = found[exposure_id]
-        result = set()
-        band = None
-        for detector_name in self.DETECTOR_NAMES:
-            if not self._has_band_suffix:
-                path = base.joinpath(f"lsst_a_{exposure_id}_{detector_name}.fits")
-                if path.exists():
-                    result.add(path)
-                elif not self._allow_incomplete:
+        base = os.fspath(found[exposure_id])
+        # These directories hold many exposures, so one listing is much
+        # cheaper than checking for each expected file individually (and
+        # leaves no per-file stat calls that would be worth batching).  We also
+        # remember inode numbers, so we can return files in roughly on-disk
+        # order, which makes reading them during ingest more sequential.
+        with os.scandir(base) as entries:
+            inodes = {entry.name: entry.inode() for entry in entries}
+        names = inodes.keys()
+        prefix = f"lsst_a_{exposure_id}_"
+        if not self._has_band_suffix:
+            suffix = ".fits"
+        else:
+            # All raws for an exposure have the same band, so we just need
+            # to find it once.
+            band = next(
+                (b for d in self.DETECTOR_NAMES for b in "ugrizy" if f"{prefix}{d}_{b}.fits" in names),
+                None,
+            )
+            if band is None:
+                if not self._allow_incomplete:
+                    raise FileNotFoundError(
+                        f"Missing raw with detector={self.DETECTOR_NAMES[0]} for {exposure_id}."
+                    )
+                return []
+            suffix = f"_{band}.fits"
+        # Detector names are unique, so the candidate filenames are too; we
+        # can just filter a list rather than building a set.
+        candidates = [f"{prefix}{detector_name}{suffix}" for detector_name in self.DETECTOR_NAMES]
+        if self._allow_incomplete:
+            result = [name for name in candidates if name in names]
+        else:
+            for detector_name, name in zip(self.DETECTOR_NAMES, candidates):
+                if name not in names:
+                    if self._has_band_suffix:
+                        raise FileNotFoundError(f"Missing raw with detector={detector_name} (assuming "
+                                                f"band {band}) for {exposure_id}.")
                     raise FileNotFoundError(f"Missing raw with detector={detector_name} for {exposure_id}.")
-            elif band is None:
-                for trial_band in "ugrizy":
-                    path = base.joinpath(f"lsst_a_{exposure_id}_{detector_name}_{trial_band}.fits")
-                    if path.exists():
-                        band = trial_band
-                        result.add(path)
-                        break
-                else:
-                    if not self._allow_incomplete:
-                        raise FileNotFoundError(
-                            f"Missing raw with detector={detector_name} for {exposure_id}."
-                        )
-            else:
-                path = base.joinpath(f"lsst_a_{exposure_id}_{detector_name}_{band}.fits")
-                if path.exists():
-                    result.add(path)
-                elif not self._allow_incomplete:
-                    raise FileNotFoundError(f"Missing raw with detector={detector_name} (assuming band "
-                                            f"{band}) for {exposure_id}.")
-        return result
+            result = candidates
+        result.sort(key=inodes.__getitem__)
+        return [os.path.join(base, name) for name in result]
 
 
 ingest_raws = functools.partial(ingest.ingest_raws, instrument_name="LSSTCam-imSim",
@@ -29,12 +29,13 @@ __all__ = (
     "WriteStrayLightData",
 )
 
-from collections import defaultdict
+import functools
 import logging
 import os
 from pathlib import Path
+import re
 import textwrap
-from typing import Any, Dict, Iterator, Optional, Set, Tuple, TYPE_CHECKING
+from typing import Any, Dict, FrozenSet, Iterator, List, Mapping, Optional, Tuple, TYPE_CHECKING, Union
 
 from .._operation import AdminOperation, OperationNotReadyError, SimpleStatus
 from .. import ingest
@@ -42,7 +43,6 @@ from .. import calibs
 from .. import common
 
 if TYPE_CHECKING:
-    import re
     from lsst.daf.butler import DataCoordinate
     from lsst.skymap import BaseSkyMap
     from .._tool import RepoAdminTool
@@ -120,19 +120,31 @@ class HyperSuprimeCamExposureFinder(ingest.UnstructuredExposureFinder):
         Forwarded to `UnstructuredExposureFinder`.
     """
 
+    __slots__ = ("_allow_incomplete", "_last_listing")
+
     def __init__(self, root: Path, *, allow_incomplete: bool = False, **kwargs: Any):
         super().__init__(root, self.FILE_REGEX, **kwargs)
         self._root = root
         self._allow_incomplete = allow_incomplete
+        self._last_listing: Optional[Tuple[str, FrozenSet[str]]] = None
 
-    FILE_REGEX = r"HSCA(\d{8}).fits"
+    FILE_REGEX = re.compile(r"HSCA(\d{6})\d{2}\.fits\Z", re.ASCII)
 
-    DETECTOR_NUMS_FOR_FILENAMES = (
-        list(range(0, 49)) + list(range(51, 58)) + list(range(100, 149)) + list(range(151, 158))
-    )
+    DETECTOR_NUMS_FOR_FILENAMES = (*range(0, 49), *range(51, 58), *range(100, 149), *range(151, 158))
     """HSC internal detector IDs used in filenames.
     """
 
+    DETECTOR_FILENAME_TAILS = tuple(
+        (n // 100, f"{n % 100:02d}.fits") for n in DETECTOR_NUMS_FOR_FILENAMES
+    )
+    """Precomputed ``(offset, tail)`` pairs for each entry in
+    `DETECTOR_NUMS_FOR_FILENAMES`.
+
+    The raw for a detector is named ``HSCA{exposure_id + offset:06d}{tail}``;
+    detectors numbered 100 and up use the next (odd) number, as they would if
+    we just added the detector number to ``exposure_id*100``.
+    """
+
     def extract_exposure_id(self, tool: RepoAdminTool, match: re.Match) -> int:
         # Docstring inherited.
         # HSC visit/exposure IDs are always even-numbered, to allow for
@@ -140,23 +152,46 @@ class HyperSuprimeCamExposureFinder(ingest.UnstructuredExposureFinder):
         # old Supreme-Cam.  The CCD identifiers here aren't the
         # pure-integer ones we prefer to use in the pipelines, so we ignore
         # them entirely; we'll get those from metadata extraction during
-        # actualy ingest anyway.
-        exposure_id = int(match.group(1)) // 100
-        exposure_id -= exposure_id % 2
+        # actualy ingest anyway (FILE_REGEX doesn't even capture them).
+        exposure_id = int(match.group(1))
+        exposure_id -= exposure_id & 1
         return exposure_id
 
-    def expand(self, tool: RepoAdminTool, exposure_id: int, found: Dict[int, Path]) -> Set[Path]:
+    def expand(
+        self, tool: RepoAdminTool, exposure_id: int, found: Mapping[int, Union[str, Path]]
+    ) -> List[str]:
         # Docstring inherited.
-        base = found[exposure_id]
-        result = set()
-        for detector_num in self.DETECTOR_NUMS_FOR_FILENAMES:
-            path = base.joinpath(f"HSCA{exposure_id*100 + detector_num:08d}.fits")
-            if path.exists():
-                result.add(path)
+        base = os.fspath(found[exposure_id])
+        names = self._list_directory(base)
+        prefixes = (f"HSCA{exposure_id:06d}", f"HSCA{exposure_id + 1:06d}")
+        # Joining with an empty last component just adds the separator; we
+        # do that once and then concatenate for each file.
+        dir_prefix = os.path.join(base, "")
+        result = []
+        for offset, tail in self.DETECTOR_FILENAME_TAILS:
+            name = prefixes[offset] + tail
+            if name in names:
+                result.append(dir_prefix + name)
             elif not self._allow_incomplete:
-                raise FileNotFoundError(f"Missing raw {path} for {exposure_id}.")
+                raise FileNotFoundError(f"Missing raw {dir_prefix + name} for {exposure_id}.")
         return result
 
+    def _list_directory(self, directory: str) -> FrozenSet[str]:
+        """Return the names of all entries in a directory.
+
+        Raw directories usually hold many exposures, so one listing is much
+        cheaper than checking for each expected file individually.
+        `RawIngest.run` expands exposures in sorted ID order, and exposures
+        with neighboring IDs are usually in the same directory, so we also
+        keep the most recent listing around.
+        """
+        if self._last_listing is not None and self._last_listing[0] == directory:
+            return self._last_listing[1]
+        with os.scandir(directory) as entries:
+            names = frozenset(entry.name for entry in entries)
+        self._last_listing = (directory, names)
+        return names
+
 
 class WriteStrayLightData(calibs.CalibrationOperation):
     """A concrete `AdminOperation` that copies HSC's special y-band stray light
@@ -219,6 +254,13 @@ class IngestBrightObjectMasks(AdminOperation):
 
     FILE_REGEX_TEMPLATE = r"BrightObjectMask-{tract_id}-(?P<x>\d+),(?P<y>\d+)-(?P<filter>[\w\-]+)\.reg"
 
+    TRACTS_PER_INGEST = 16
+    """Number of tracts whose masks are ingested by each `Butler.ingest` call.
+
+    Most tracts only have a few hundred mask files, so batching several
+    together amortizes the per-call registry overhead.
+    """
+
     def print_status(self, tool: RepoAdminTool, indent: int) -> None:
         # Docstring inherited.
         SimpleStatus.check(self, tool).print_status(self, tool, indent)
@@ -235,14 +277,22 @@ class IngestBrightObjectMasks(AdminOperation):
             with SimpleStatus.run_context(self, tool):
                 tool.butler.registry.registerCollection(self._collection, CollectionType.RUN)
                 tool.butler.registry.registerDatasetType(dataset_type)
+                fds = []
+                n_pending = 0
                 for tract_data in tool.progress.wrap(found_iter, total=n_tracts, desc="Ingesting by tract"):
-                    fds = tuple(
+                    fds.extend(
                         FileDataset(
-                            path=str(path),
+                            path=path,
                             refs=[DatasetRef(dataset_type, data_id) for data_id in data_ids],
                         )
                         for path, data_ids in tract_data.items()
                     )
+                    n_pending += 1
+                    if n_pending == self.TRACTS_PER_INGEST:
+                        tool.butler.ingest(*fds, transfer="direct", run=self._collection)
+                        fds.clear()
+                        n_pending = 0
+                if fds:
                     tool.butler.ingest(*fds, transfer="direct", run=self._collection)
         else:
             n_files = 0
@@ -253,7 +303,7 @@ class IngestBrightObjectMasks(AdminOperation):
                     n_data_ids += len(data_ids)
             print(f"Found {n_files} distinct files for {n_data_ids} data IDs, over {n_tracts} tracts.")
 
-    def find(self, tool: RepoAdminTool) -> Tuple[int, Iterator[Dict[Path, Set[DataCoordinate]]]]:
+    def find(self, tool: RepoAdminTool) -> Tuple[int, Iterator[Dict[str, List[DataCoordinate]]]]:
         """Scan the filesystem for BrightObjectMask datasets to ingest.
 
         Parameters
@@ -265,14 +315,19 @@ class IngestBrightObjectMasks(AdminOperation):
         -------
         n_tracts : `int`
             Number of tracts found.
-        data_ids_by_path : `Iterator` [ `dict` [ `Path`, `DataCoordinate` ] ]
-            Iterator over dictionaries that map file paths to their data IDs,
-            with one tract per dictionary.
+        data_ids_by_path : `Iterator` [ `dict` [ `str`, `list` ] ]
+            Iterator over dictionaries that map file paths to their (unique)
+            data IDs, with one tract per dictionary.  Paths are kept as
+            strings, since that is what `FileDataset` needs.
         """
         from lsst.daf.butler import DataCoordinate
         tracts = {}
-        for entry in tool.progress.wrap(os.scandir(self._root), "Scanning for tracts"):
-            if entry.is_dir(follow_symlinks=False):
+        with os.scandir(self._root) as entries:
+            for entry in tool.progress.wrap(entries, "Scanning for tracts"):
+                # Skip anything that isn't a tract directory (e.g. README
+                # files or scratch directories) without raising.
+                if not entry.name.isdecimal() or not entry.is_dir(follow_symlinks=False):
+                    continue
                 tracts[int(entry.name)] = entry.path
         if not tracts:
             raise RuntimeError("No tract directories found in {self._root)")
@@ -280,19 +335,29 @@ class IngestBrightObjectMasks(AdminOperation):
         filters = {r.name: r.band for r in tool.butler.registry.queryDimensionRecords("physical_filter",
                                                                                       instrument="HSC")}
 
-        def iter() -> Iterator[Dict[Path, DataCoordinate]]:
+        # Bind loop invariants to locals; this loop runs once per mask file.
+        standardize = DataCoordinate.standardize
+        universe = tool.butler.registry.dimensions
+        skymap_name = self._skymap_name
+
+        def iter() -> Iterator[Dict[str, List[DataCoordinate]]]:
             for tract_id, tract_root in tracts.items():
                 n_patches_x, _ = skyMap[tract_id].getNumPatches()
-                file_regex = self.FILE_REGEX_TEMPLATE.format(tract_id=tract_id)
-                found = defaultdict(set)
-                for path, match in ingest.ExposureFinder.recursive_regex(tool, tract_root, file_regex,
-                                                                         follow_symlinks=True):
+                file_regex = re.compile(self.FILE_REGEX_TEMPLATE.format(tract_id=tract_id))
+                found: Dict[str, List[DataCoordinate]] = {}
+                for path, match in ingest.ExposureFinder.iter_regex_matches(tool, tract_root, file_regex,
+                                                                            follow_symlinks=True):
                     band = filters[match.group("filter")]
                     patch_id = int(match.group("y"))*n_patches_x + int(match.group("x"))
-                    data_id = DataCoordinate.standardize(skymap=self._skymap_name, tract=tract_id,
-                                                         patch=patch_id, band=band,
-                                                         universe=tool.butler.registry.dimensions)
-                    found[path].add(data_id)
+                    data_id = standardize(skymap=skymap_name, tract=tract_id, patch=patch_id, band=band,
+                                          universe=universe)
+                    # Almost every file has exactly one data ID, so a list
+                    # is cheaper than a set; a file only has more than one
+                    # when symlinks with different names share a target.
+                    if (data_ids := found.get(path)) is None:
+                        found[path] = [data_id]
+                    elif data_id not in data_ids:
+                        data_ids.append(data_id)
                 yield found
         return len(tracts), iter()
 
@@ -345,11 +410,7 @@ def define_rc2_tags() -> Iterator[AdminOperation]:
         yield common.DefineTag(
             f"HSC-tags-RC2-raw-{tract_id}",
             f"HSC/raw/RC2/{tract_id}",
-            [
-                (("raw",), dict(instrument="HSC", collections=["HSC/raw/all"], exposure=v,
-                                where="detector != 9 AND detector.purpose='SCIENCE'"))
-                for v in RC2_VISITS[tract_id]
-            ],
+            functools.partial(_rc2_raw_query_args, tract_id),
             doc=textwrap.fill(
                 "Raws included in the Release Candidate 2 medium-scale test dataset "
                 f"(see DM-11345), overlapping tract {tract_id} in {tract_name}."
@@ -365,8 +426,23 @@ def define_rc2_tags() -> Iterator[AdminOperation]:
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _rc2_raw_query_args(tract_id: int) -> Tuple[Tuple[tuple, dict], ...]:
+    """Return the `DefineTag` query arguments for the RC2 raws that overlap a
+    tract.
+
+    The result is cached, since `DefineTag` asks for it in both `print_status`
+    and `run`; callers must not modify it.
+    """
+    return tuple(
+        (("raw",), dict(instrument="HSC", collections=["HSC/raw/all"], exposure=v,
+                        where="detector != 9 AND detector.purpose='SCIENCE'"))
+        for v in RC2_VISITS[tract_id]
+    )
+
+
 RC2_VISITS = {
-    9615: [
+    9615: (
         26024, 26028, 26032, 26036, 26044, 26046, 26048, 26050, 26058,
         26060, 26062, 26070, 26072, 26074, 26080, 26084, 26094,
         23864, 23868, 23872, 23876, 23884, 23886, 23888, 23890, 23898,
@@ -380,8 +456,8 @@ RC2_VISITS = {
         380, 384, 388, 404, 408, 424, 426, 436, 440, 442, 446, 452, 456,
         458, 462, 464, 468, 470, 472, 474, 478, 27032, 27034, 27042,
         27066, 27068,
-    ],
-    9697: [
+    ),
+    9697: (
         6320, 34338, 34342, 34362, 34366, 34382, 34384, 34400, 34402,
         34412, 34414, 34422, 34424, 34448, 34450, 34464, 34468, 34478,
         34480, 34482, 34484, 34486,
@@ -400,8 +476,8 @@ RC2_VISITS = {
         36756, 36758, 36762, 36768, 36772, 36774, 36776, 36778, 36788,
         36790, 36792, 36794, 36800, 36802, 36808, 36810, 36812, 36818,
         36820, 36828, 36830, 36834, 36836, 36838,
-    ],
-    9813: [
+    ),
+    9813: (
         11690, 11692, 11694, 11696, 11698, 11700, 11702, 11704, 11706,
         11708, 11710, 11712, 29324, 29326, 29336, 29340, 29350,
         1202, 1204, 1206, 1208, 1210, 1212, 1214, 1216, 1218, 1220, 23692,
@@ -423,5 +499,5 @@ RC2_VISITS = {
         23038, 23040, 23042, 23044, 23046, 23048, 23050, 23052, 23054, 23056,
         23594, 23596, 23598, 23600, 23602, 23604, 23606, 24298, 24300, 24302,
         24304, 24306, 24308, 24310, 25810, 25812, 25814, 25816,
-    ],
+    ),
 }
@@ -23,8 +23,8 @@
 
 The subpackages of this package should correspond directly to compute sites
 that host data repositories.  The `RepoDefinition` objects that aggregate these
-definitions must be added to the ``REPOS`` dictionary exported directly by this
-package.
+definitions must be added to the (read-only) ``REPOS`` mapping exported directly
+by this package, which is built in ``_repos.py``.
 """
 
 __all__ = ()
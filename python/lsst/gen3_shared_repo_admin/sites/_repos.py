@@ -22,11 +22,12 @@
 __all__ = ("REPOS",)
 
 import itertools
+import types
 
 from . import ncsa
 
-REPOS = {
+REPOS = types.MappingProxyType({
     (repo.name, repo.date, repo.site.name): repo for repo in itertools.chain(
         ncsa.repos(),
     )
-}
+})
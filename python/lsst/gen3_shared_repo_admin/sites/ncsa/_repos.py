@@ -23,21 +23,44 @@ from __future__ import annotations
 
 __all__ = ("repos",)
 
-from typing import Iterator
+import importlib
+from typing import Callable, Iterator, TYPE_CHECKING
 
 from ..._repo_definition import RepoDefinition
+from ._site import NCSA
 
-from . import ccso
-from . import dc2
-from . import main
-from . import teststand
+if TYPE_CHECKING:
+    from ..._operation import AdminOperation
 
 
 def repos() -> Iterator[RepoDefinition]:
     """Iterate over all concrete `RepoDefinition` objects defined by this
     package.
     """
-    yield from ccso.repos()
-    yield from dc2.repos()
-    yield from main.repos()
-    yield from teststand.repos()
+    yield RepoDefinition(name="ccso", date="20210215", site=NCSA, operations=_deferred("ccso"))
+    yield RepoDefinition(name="dc2", date="20210215", site=NCSA, operations=_deferred("dc2"))
+    yield RepoDefinition(name="main", date="20210215", site=NCSA, operations=_deferred("main"))
+    yield RepoDefinition(name="teststand", date="20210215", site=NCSA, operations=_deferred("teststand"))
+
+
+def _deferred(module_name: str) -> Callable[[], Iterator[AdminOperation]]:
+    """Return a callable that imports a submodule of this package and calls
+    its ``operations`` function.
+
+    The modules that define operations import much of the stack, so we don't
+    import them until a repository's operations are actually needed.
+
+    Parameters
+    ----------
+    module_name : `str`
+        Name of the submodule, relative to this package.
+
+    Returns
+    -------
+    operations : `Callable`
+        Callable with no arguments that returns an iterator over
+        `AdminOperation` instances.
+    """
+    def operations() -> Iterator[AdminOperation]:
+        return importlib.import_module(f".{module_name}", __package__).operations()
+    return operations
@@ -28,15 +28,16 @@ from __future__ import annotations
 
 __all__ = ()
 
+import functools
 from pathlib import Path
 import textwrap
-from typing import Dict, Iterator, TYPE_CHECKING
+from typing import Dict, Iterator, Mapping, Tuple, TYPE_CHECKING, Union
 
-from ..._repo_definition import RepoDefinition
 from ... import common
 from ... import calibs
 from ... import check
 from ... import doc_templates
+from ... import ingest
 from ... import reruns
 from ... import visits
 from ...instruments.dc2 import (
@@ -46,23 +47,66 @@ from ...instruments.dc2 import (
     ingest_refcat,
     UnstructuredImSimExposureFinder,
 )
-from ._site import NCSA
 
 if TYPE_CHECKING:
     from ._operation import AdminOperation
     from ._tool import RepoAdminTool
 
 
-def repos() -> Iterator[RepoDefinition]:
-    """Generate the definitions for the `/repo/dc2` data repository at NCSA.
-    """
-    yield RepoDefinition(name="dc2", date="20210215", site=NCSA, operations=operations)
+_DR6_ROOT = Path("/datasets/DC2/DR6/Run2.2i/patched/2021-02-10")
+"""Root of the (patched) Gen2 DR6 data repository, which holds the raws,
+reference catalogs, calibrations, and DESC reruns we convert.
+"""
+
+_INSTRUMENT_NAME = "LSSTCam-imSim"
+"""Short/dimension name of the instrument for all DC2 data we ingest.
+"""
+
+_UMBRELLA_SUFFIX = ("2.2i/calib", "skymaps", "refcats")
+"""Collections that follow the raw collection in each DC2 umbrella
+collection.
+"""
+
+_RAW_TAG_MED_DOC = (
+    "Raw images used as inputs for DM's medium-scale regular test processing. "
+    "This includes two tracts of y1-wfd data, tracts 3828 and 3829 and partial y2. "
+    "See DM-22954 for more information."
+)
+"""Documentation for the ``2.2i/raw/test-med-1`` collection.
+"""
+
+_DP0_CHAIN_DOC = textwrap.fill(
+    "Parent collection for all DESC DC2 DR6 WFD "
+    "processing converted from Gen2 for Data Preview 0.1."
+)
+"""Documentation for the ``2.2i/runs/DP0.1`` collection.
+"""
 
 
 def operations() -> Iterator[AdminOperation]:
     """Generate all operations used to set up the `/repo/dc2` data repository
     at NCSA.
     """
+    yield from _build_operations()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_operations() -> Tuple[AdminOperation, ...]:
+    """Construct the operations yielded by `operations`.
+
+    The tree of operations is static, so we only build it once.  It is not
+    worth building it lazily: `RepoAdminTool` flattens the full tree to look
+    up operations by name, so every operation is constructed anyway.  What is
+    deferred is importing this module at all (see ``_repos.py``), and any
+    filesystem or registry access, which only happens when operations are run
+    or report their status.
+    """
+    return tuple(_generate_operations())
+
+
+def _generate_operations() -> Iterator[AdminOperation]:
+    """Generate the operations returned by `_build_operations`.
+    """
     yield common.CreateRepo()
     yield common.RegisterSkyMap("DC2")
     yield common.RegisterInstrument("imSim-registration", "lsst.obs.lsst.LsstCamImSim")
@@ -70,11 +114,11 @@ def operations() -> Iterator[AdminOperation]:
     yield from raw_operations()
     yield from ingest_refcat(
         ticket="PREOPS-301",
-        path=Path("/datasets/DC2/DR6/Run2.2i/patched/2021-02-10/ref_cats/cal_ref_cat"),
+        path=_DR6_ROOT.joinpath("ref_cats", "cal_ref_cat"),
     )
     yield from calib_operations()
-    yield visits.DefineVisits("2.2i-visits", "LSSTCam-imSim", collections=("2.2i/raw/all",))
-    yield visits.PatchExistingVisits("2.2i-visits-patch", "LSSTCam-imSim")
+    yield visits.DefineVisits("2.2i-visits", _INSTRUMENT_NAME, collections=("2.2i/raw/all",))
+    yield visits.PatchExistingVisits("2.2i-visits-patch", _INSTRUMENT_NAME)
     yield from umbrella_operations()
     yield from dp0_rerun_operations()
     yield from med1_rerun_operations()
@@ -82,13 +126,15 @@ def operations() -> Iterator[AdminOperation]:
         "check-URIs",
         # visits are arbitrary, but cover all bands and all overlap this
         # (also-arbitrary) tract.
-        [{"instrument": "LSSTCam-imSim", "visit": v, "exposure": v,
+        [{"instrument": _INSTRUMENT_NAME, "visit": v, "exposure": v,
           "skymap": "DC2", "tract": 4644, "detector": 90}
          for v in (760247, 944265, 896824, 471974, 971097, 190279)]
     )
 
 
-def filter_test_med_1(tool: RepoAdminTool, found: Dict[int, Path]) -> Dict[int, Path]:
+def filter_test_med_1(
+    tool: RepoAdminTool, found: Mapping[int, Union[str, Path]]
+) -> Dict[int, Union[str, Path]]:
     """Raw exposure filter function (see `ExposureFinder.filtered_by`) that
     selects raws from exposures for which raws from (presumably other)
     detectors are in the ``2.2i/raw/test-med-1`` collection.
@@ -100,19 +146,78 @@ def filter_test_med_1(tool: RepoAdminTool, found: Dict[int, Path]) -> Dict[int,
     return {exposure_id: path for exposure_id, path in found.items() if exposure_id in exposures}
 
 
-@common.Group.wrap("2.2i-raw")
+@functools.lru_cache(maxsize=None)
+def _dr6_scanner() -> ImSimExposureFinder:
+    """Return the finder that scans for the DR6 WFD raws used for DP0.1.
+
+    This and the other finder getters are cached so repeated calls to
+    `raw_operations` share finder instances (and hence anything they have
+    already found).
+    """
+    return ImSimExposureFinder(
+        _DR6_ROOT.joinpath("raw"),
+        "*-R??-S??-det???-???.fits",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _dr6_finder() -> ingest.ExposureFinder:
+    """Return the finder for the DR6 WFD raws used for DP0.1, which saves
+    what `_dr6_scanner` finds.
+    """
+    return _dr6_scanner().saved_as("2.2i-raw-DR6-find")
+
+
+@functools.lru_cache(maxsize=None)
+def _monthly_finder() -> ingest.ExposureFinder:
+    """Return the finder for the raws used in DM's ~monthly test processing.
+
+    The ingest itself reads the exposures saved by the
+    ``2.2i-raw-monthly-find`` operation that `ingest_raws` adds for
+    ``save_found=True``.  The ``2.2i-raw-monthly-tag`` operation is given
+    this finder unwrapped (as `ingest_raws` does for every tag), and it is
+    the only operation that calls `~ImSimExposureFinder.find` directly.  The
+    on-disk cache keeps each tag run from listing the root directory again.
+    """
+    return ImSimExposureFinder(
+        Path("/datasets/DC2/repoRun2.2i/raw"),
+        "*-R??-S??-det???.fits",
+        cache_on_disk=True,
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _missing_finder() -> ingest.ExposureFinder:
+    """Return the finder for raws missing from the original DP0 transfer.
+    """
+    return UnstructuredImSimExposureFinder(
+        Path("/datasets/DC2/raw/Run2.2i/dp0-missing"),
+        has_band_suffix=True,
+        allow_incomplete=True,
+    )
+
+
 def raw_operations() -> Iterator[AdminOperation]:
     """Generate all operations used to ingest DC2 raws.
     """
+    # The DR6 and monthly raws live in independent directory trees, so scan
+    # them concurrently rather than one after the other.
+    yield ingest.PrefetchFindsGroup(
+        "2.2i-raw",
+        _raw_operations(),
+        finders=(_dr6_scanner(), _monthly_finder()),
+    )
+
+
+def _raw_operations() -> Iterator[AdminOperation]:
+    """Generate the operations grouped by `raw_operations`.
+    """
     # The DR6 WFD raw dataset used for DP0.1; save this large list of exposures
     # to a file (as an operation of its own), then split it up into 4
     # (arbitrary) sets we can ingest in parallel.
     yield from ingest_raws(
         "2.2i-raw-DR6",
-        ImSimExposureFinder(
-            Path("/datasets/DC2/DR6/Run2.2i/patched/2021-02-10/raw"),
-            "*-R??-S??-det???-???.fits",
-        ).saved_as("2.2i-raw-DR6-find"),
+        _dr6_finder(),
         split_into=4,
         save_found=True,
         tag_as="2.2i/raw/DP0",
@@ -124,17 +229,10 @@ def raw_operations() -> Iterator[AdminOperation]:
     # that it's already done even before we run it.
     yield from ingest_raws(
         "2.2i-raw-monthly",
-        ImSimExposureFinder(
-            Path("/datasets/DC2/repoRun2.2i/raw"),
-            "*-R??-S??-det???.fits",
-        ),
+        _monthly_finder(),
         save_found=True,
         tag_as="2.2i/raw/test-med-1",
-        tag_doc=(
-            "Raw images used as inputs for DM's medium-scale regular test processing. "
-            "This includes two tracts of y1-wfd data, tracts 3828 and 3829 and partial y2. "
-            "See DM-22954 for more information."
-        ),
+        tag_doc=_RAW_TAG_MED_DOC,
     )
     # Raw calibrations from Jim Chiang, via Chris Waters.  These were not in a
     # permanent location at NCSA previously, so we ingest them with
@@ -167,11 +265,7 @@ def raw_operations() -> Iterator[AdminOperation]:
     # ingesting earlier.  We ingest those from the path below rather than the
     # the other /datasets/DC2/raw/Run2.2i to limit the number of raw URI
     # roots/patterns we have in the database.
-    missing = UnstructuredImSimExposureFinder(
-        Path("/datasets/DC2/raw/Run2.2i/dp0-missing"),
-        has_band_suffix=True,
-        allow_incomplete=True,
-    )
+    missing = _missing_finder()
     # Define the subset of the missing subset in test-med-1 separately, because
     # these can be ingested in several minutes rather than ~ a day.
     yield from ingest_raws(
@@ -192,34 +286,35 @@ def raw_operations() -> Iterator[AdminOperation]:
 def calib_operations() -> Iterator[AdminOperation]:
     """Generate all operations used to ingest/convert DC2 master calibrations.
     """
-    root = Path("/datasets/DC2/DR6/Run2.2i/patched/2021-02-10")
+    root = _DR6_ROOT
+    repo_path = root.joinpath("CALIB")
     yield calibs.WriteCuratedCalibrations(
         "2.2i-calibs-curated",
-        "LSSTCam-imSim",
+        _INSTRUMENT_NAME,
         labels=("PREOPS-301",),
         collection_prefix="2.2i",
     )
     yield calibs.WriteCuratedCalibrations(
         "2.2i-calibs-curated+bf",
-        "LSSTCam-imSim",
+        _INSTRUMENT_NAME,
         labels=("DM-30694",),
         collection_prefix="2.2i",
     )
     yield calibs.ConvertCalibrations(
         name="2.2i-calibs-convert",
-        instrument_name="LSSTCam-imSim",
+        instrument_name=_INSTRUMENT_NAME,
         labels=("gen2",),
         root=root,
-        repo_path=root.joinpath("CALIB"),
+        repo_path=repo_path,
         collection_prefix="2.2i",
         dataset_type_names=("flat", "bias", "dark", "fringe"),
     )
     yield calibs.ConvertCalibrations(
         name="2.2i-calibs-sky",
-        instrument_name="LSSTCam-imSim",
+        instrument_name=_INSTRUMENT_NAME,
         labels=("gen2",),
         root=root,
-        repo_path=root.joinpath("CALIB"),
+        repo_path=repo_path,
         collection_prefix="2.2i",
         dataset_type_names=("sky",),
         # obs_lsst master has different templates, and these names
@@ -249,34 +344,22 @@ def umbrella_operations() -> Iterator[AdminOperation]:
     """
     yield common.DefineChain(
         "2.2i-defaults-all",
-        "2.2i/defaults", (
-            "2.2i/raw/all",
-            "2.2i/calib",
-            "skymaps",
-            "refcats",
-        ),
+        "2.2i/defaults",
+        ("2.2i/raw/all",) + _UMBRELLA_SUFFIX,
         doc=doc_templates.UMBRELLA.format(tail="all available DC2 run2.2i data."),
     )
     yield common.DefineChain(
         "2.2i-defaults-DR6",
-        "2.2i/defaults/DP0", (
-            "2.2i/raw/DP0",
-            "2.2i/calib",
-            "skymaps",
-            "refcats",
-        ),
+        "2.2i/defaults/DP0",
+        ("2.2i/raw/DP0",) + _UMBRELLA_SUFFIX,
         doc=doc_templates.UMBRELLA.format(
             tail="the DC2 DR6 WFD subset designated for Data Preview 0."
         ),
     )
     yield common.DefineChain(
         "2.2i-defaults-monthly",
-        "2.2i/defaults/test-med-1", (
-            "2.2i/raw/test-med-1",
-            "2.2i/calib",
-            "skymaps",
-            "refcats",
-        ),
+        "2.2i/defaults/test-med-1",
+        ("2.2i/raw/test-med-1",) + _UMBRELLA_SUFFIX,
         doc=doc_templates.UMBRELLA.format(
             tail="the DC2 subset used for DM's medium-scale regular test processing."
         ),
@@ -288,6 +371,7 @@ def dp0_rerun_operations() -> Iterator[AdminOperation]:
     """Generate all operations used to convert (to Gen3) the DESC-processed DR6
     WFD reruns that will be re-released as DP0.1.
     """
+    base = dict(instrument_name=_INSTRUMENT_NAME, root=str(_DR6_ROOT))
     # Coaddition and coadd-processing repos are small enough to be converted
     # in one go.
     full_repo_steps = {
@@ -295,59 +379,43 @@ def dp0_rerun_operations() -> Iterator[AdminOperation]:
         "-coadd-wfd-dr6-v1-u": "coadd/wfd/dr6/v1/u",
         "-coadd-wfd-dr6-v1": "coadd/wfd/dr6/v1",
     }
-    rerun_ops = [
-        reruns.ConvertRerun(
-            f"2.2i-rerun-DP0-{v.replace('/', '-')}",
-            instrument_name="LSSTCam-imSim",
-            root="/datasets/DC2/DR6/Run2.2i/patched/2021-02-10",
-            repo_path=f"rerun/run2.2i{k}",
-            run_name=f"2.2i/runs/DP0.1/{v}",
-            include=("*",),
-            exclude=(),
-        )
-        for k, v in full_repo_steps.items()
-    ]
     # The calexp repo is so big we convert it in a few steps, splitting up the
-    # dataset types.
+    # dataset types.  These all share a Gen2 repo and output RUN collection.
+    calexp = dict(base, repo_path="rerun/run2.2i-calexp-v1", run_name="2.2i/runs/DP0.1/calexp/v1")
     # This first bunch got ingested via an earlier operation definition that
     # didn't split them up.
     done_first = ("calexp", "calexpBackground", "icSrc", "icSrc_schema", "src_schema")
-    rerun_ops.append(
-        reruns.ConvertRerun(
-            "2.2i-rerun-DP0-calexp-0",
-            instrument_name="LSSTCam-imSim",
-            root="/datasets/DC2/DR6/Run2.2i/patched/2021-02-10",
-            repo_path="rerun/run2.2i-calexp-v1",
-            run_name="2.2i/runs/DP0.1/calexp/v1",
-            include=done_first,
-            exclude=(),
-        )
-    )
     # Make each other regular dataset its own step
     full_dataset_types = ("src", "skyCorr", "srcMatch")
-    rerun_ops.extend(
-        reruns.ConvertRerun(
-            f"2.2i-rerun-DP0-calexp-{dataset_type}",
-            instrument_name="LSSTCam-imSim",
-            root="/datasets/DC2/DR6/Run2.2i/patched/2021-02-10",
-            repo_path="rerun/run2.2i-calexp-v1",
-            run_name="2.2i/runs/DP0.1/calexp/v1",
-            include=(dataset_type,),
-            exclude=(),
-        )
-        for dataset_type in full_dataset_types
-    )
-    # Add one more step for miscellaneous things, like config datasets.
-    rerun_ops.append(
+    rerun_ops = (
+        *(
+            reruns.ConvertRerun(
+                f"2.2i-rerun-DP0-{v.replace('/', '-')}",
+                repo_path=f"rerun/run2.2i{k}",
+                run_name=f"2.2i/runs/DP0.1/{v}",
+                include=("*",),
+                exclude=(),
+                **base,
+            )
+            for k, v in full_repo_steps.items()
+        ),
+        reruns.ConvertRerun("2.2i-rerun-DP0-calexp-0", include=done_first, exclude=(), **calexp),
+        *(
+            reruns.ConvertRerun(
+                f"2.2i-rerun-DP0-calexp-{dataset_type}",
+                include=(dataset_type,),
+                exclude=(),
+                **calexp,
+            )
+            for dataset_type in full_dataset_types
+        ),
+        # Add one more step for miscellaneous things, like config datasets.
         reruns.ConvertRerun(
             "2.2i-rerun-DP0-calexp-misc",
-            instrument_name="LSSTCam-imSim",
-            root="/datasets/DC2/DR6/Run2.2i/patched/2021-02-10",
-            repo_path="rerun/run2.2i-calexp-v1",
-            run_name="2.2i/runs/DP0.1/calexp/v1",
             include=("*",),
             exclude=done_first + full_dataset_types,
-        )
+            **calexp,
+        ),
     )
     inputs = ("2.2i/raw/DP0", "2.2i/calib", "refcats", "skymaps")
     yield from rerun_ops
@@ -358,10 +426,7 @@ def dp0_rerun_operations() -> Iterator[AdminOperation]:
             f"2.2i/runs/DP0.1/{v}"
             for v in (list(reversed(full_repo_steps.values())) + ["calexp/v1"])
         ) + inputs,
-        doc=textwrap.fill(
-            "Parent collection for all DESC DC2 DR6 WFD "
-            "processing converted from Gen2 for Data Preview 0.1."
-        ),
+        doc=_DP0_CHAIN_DOC,
         flatten=True,
     )
 
@@ -388,22 +453,24 @@ def med1_rerun_operations() -> Iterator[AdminOperation]:
         "w_2020_48": "DM-27780",
     }.items():
         def generate() -> Iterator[AdminOperation]:
-            chain = ["2.2i/defaults/test-med-1"]
-            for suffix in ("sfm", "coadd", "multi"):
+            steps = ("sfm", "coadd", "multi")
+            for suffix in steps:
                 yield reruns.ConvertRerun(
                     f"2.2i-rerun-RC2-{weekly}-{suffix}",
-                    instrument_name="LSSTCam-imSim",
+                    instrument_name=_INSTRUMENT_NAME,
                     root="/datasets/DC2/repoRun2.2i",
                     repo_path=f"rerun/{weekly}/{ticket}/{suffix}",
                     run_name=f"2.2i/runs/test-med-1/{weekly}/{ticket}/{suffix}",
                     include=("*",),
                     exclude=("*_metadata", "raw", "ref_cat"),
                 )
-                chain.insert(0, f"2.2i/runs/test-med-1/{weekly}/{ticket}/{suffix}")
             yield common.DefineChain(
                 f"2.2i-rerun-med1-{weekly}-chain",
                 f"2.2i/runs/test-med-1/{weekly}/{ticket}",
-                tuple(chain),
+                # Later steps come first, so their outputs take precedence.
+                tuple(
+                    f"2.2i/runs/test-med-1/{weekly}/{ticket}/{suffix}" for suffix in reversed(steps)
+                ) + ("2.2i/defaults/test-med-1",),
                 doc=textwrap.fill(
                     f"DM reprocessing of the test-med-1 dataset with weekly {weekly} on ticket {ticket}, "
                     "(converted from Gen2 repo at /datasets/DC2/repoRun2.2i).",
@@ -26,9 +26,10 @@ from __future__ import annotations
 
 __all__ = ()
 
+import functools
+import os
 from pathlib import Path
-import textwrap
-from typing import Iterator, Optional
+from typing import Iterator, Optional, Tuple, Union
 
 from ..._operation import AdminOperation
 from ... import calibs
@@ -36,6 +37,7 @@ from ... import common
 from ... import reruns
 from ... import visits
 from ... import doc_templates
+from ...ingest import PrefetchFindsGroup, RawIngest
 from ...instruments.hsc import (
     IngestBrightObjectMasks,
     define_rc2_tags,
@@ -44,7 +46,6 @@ from ...instruments.hsc import (
 )
 
 
-@common.Group.wrap("HSC")
 def operations() -> Iterator[AdminOperation]:
     """Generate all operations used to set up HSC data in the `/repo/main` data
     repository at NCSA.
@@ -53,6 +54,23 @@ def operations() -> Iterator[AdminOperation]:
     these are considered shared by all instruments in the data repository (even
     if some are primarily used for HSC processing).
     """
+    yield from _build_operations()
+
+
+@functools.lru_cache(maxsize=1)
+def _build_operations() -> Tuple[AdminOperation, ...]:
+    """Construct the operations yielded by `operations`.
+
+    As in the DC2 definitions, the tree of operations is static, so we only
+    build it once per process.
+    """
+    return tuple(_generate_operations())
+
+
+@common.Group.wrap("HSC")
+def _generate_operations() -> Iterator[AdminOperation]:
+    """Generate the operations returned by `_build_operations`.
+    """
     yield common.RegisterInstrument("HSC-registration", "lsst.obs.subaru.HyperSuprimeCam")
     yield from raw_operations()
     yield from calib_operations()
@@ -77,22 +95,36 @@ def operations() -> Iterator[AdminOperation]:
     yield from rerun_operations()
 
 
-@common.Group.wrap("HSC-raw")
+_RAW_SUBDIRS = ("commissioning", "cosmos", "newhorizons", "ssp_extra", "ssp_pdr1", "ssp_pdr2", "sxds-i2")
+"""Subdirectories of ``/datasets/hsc/raw`` that are each ingested separately.
+"""
+
+
 def raw_operations() -> Iterator[AdminOperation]:
     """Generate all operations used to ingest raw HSC data in the `/repo/main`
     data repository at NCSA.
     """
     top = Path("/datasets/hsc/raw")
-    for subdir in ("commissioning", "cosmos", "newhorizons", "ssp_extra", "ssp_pdr1", "ssp_pdr2", "sxds-i2"):
-        yield from ingest_raws(
-            f"HSC-raw-{subdir}",
-            top.joinpath(subdir),
-            save_found=True,
-            resolve_duplicates=reject_domeflat_duplicates if subdir == "newhorizons" else None,
+    ingests = []
+    for subdir in _RAW_SUBDIRS:
+        ingests.extend(
+            ingest_raws(
+                f"HSC-raw-{subdir}",
+                top.joinpath(subdir),
+                save_found=True,
+                resolve_duplicates=reject_domeflat_duplicates if subdir == "newhorizons" else None,
+            )
         )
+    # The scans of each subdirectory are independent and dominated by
+    # filesystem latency, so run any that haven't been saved yet all at once.
+    yield PrefetchFindsGroup(
+        "HSC-raw",
+        ingests,
+        finders=[op.finder for op in ingests if isinstance(op, RawIngest)],
+    )
 
 
-def reject_domeflat_duplicates(a: Path, b: Path) -> Optional[Path]:
+def reject_domeflat_duplicates(a: Union[str, Path], b: Union[str, Path]) -> Optional[Union[str, Path]]:
     """A duplicate-resolution function for use with
     `ingest.UnstructuredExposureFinder`.
 
@@ -100,9 +132,9 @@ def reject_domeflat_duplicates(a: Path, b: Path) -> Optional[Path]:
     with some appearing in a 'domeflat' subdirectory.  This function selects
     those that aren't in those subdirectories.
     """
-    if "domeflat" in str(a):
+    if "domeflat" in os.fspath(a):
         return b
-    if "domeflat" in str(b):
+    if "domeflat" in os.fspath(b):
         return a
     return None
 
@@ -116,6 +148,7 @@ def calib_operations() -> Iterator[AdminOperation]:
     root_path = Path("/datasets/hsc/repo")
     top_path = Path("/datasets/hsc/calib")
     for subdir in ("20180117", "20200115"):
+        repo_path = top_path.joinpath(subdir)
         yield common.Group(
             f"HSC-calibs-{subdir}", (
                 calibs.ConvertCalibrations(
@@ -123,12 +156,12 @@ def calib_operations() -> Iterator[AdminOperation]:
                     instrument_name="HSC",
                     labels=("gen2", subdir),
                     root=root_path,
-                    repo_path=top_path.joinpath(subdir),
+                    repo_path=repo_path,
                 ),
                 WriteStrayLightData(
                     name=f"HSC-calibs-{subdir}-straylight",
                     labels=("gen2", subdir),
-                    directory=top_path.joinpath(subdir, "STRAY_LIGHT"),
+                    directory=repo_path.joinpath("STRAY_LIGHT"),
                 ),
             )
         )
@@ -177,6 +210,16 @@ def mask_operations() -> Iterator[AdminOperation]:
     )
 
 
+_RC2_RERUN_INPUTS = ("HSC/raw/RC2", "HSC/calib", "HSC/masks", "skymaps", "refcats")
+"""Input collections that follow the output runs in each RC2 rerun's chain.
+"""
+
+_RC2_RERUN_CHAIN_DOC = doc_templates.WrappedStringTemplate(
+    "HSC RC2 processing with weekly {weekly} on ticket {ticket}, "
+    "(converted from Gen2 repo at /datasets/hsc/repo)."
+)
+
+
 @common.Group.wrap("HSC-rerun")
 def rerun_operations() -> Iterator[AdminOperation]:
     """Generate all operations used to convert HSC processing runs
@@ -200,26 +243,28 @@ def rerun_operations() -> Iterator[AdminOperation]:
         "w_2020_42": "DM-27244",
     }.items():
         def generate() -> Iterator[AdminOperation]:
-            chain = ["HSC/raw/RC2", "HSC/calib", "HSC/masks", "skymaps", "refcats"]
+            prefix = f"HSC/runs/RC2/{weekly}/{ticket}"
+            chain = []
             for old_suffix, new_suffix in {"-sfm": "sfm", "": "rest"}.items():
+                run_name = f"{prefix}/{new_suffix}"
                 yield reruns.ConvertRerun(
                     f"HSC-rerun-RC2-{weekly}-{new_suffix}",
                     instrument_name="HSC",
                     root="/datasets/hsc/repo",
                     repo_path=f"rerun/RC/{weekly}/{ticket}{old_suffix}",
-                    run_name=f"HSC/runs/RC2/{weekly}/{ticket}/{new_suffix}",
+                    run_name=run_name,
                     include=("*",),
                     exclude=("*_metadata", "raw", "brightObjectMask", "ref_cat"),
                 )
-                chain.insert(0, f"HSC/runs/RC2/{weekly}/{ticket}/{new_suffix}")
+                chain.append(run_name)
+            # Later steps go first in the chain, followed by the inputs.
+            chain.reverse()
+            chain.extend(_RC2_RERUN_INPUTS)
             yield common.DefineChain(
                 f"HSC-rerun-RC2-{weekly}-chain",
-                f"HSC/runs/RC2/{weekly}/{ticket}",
+                prefix,
                 tuple(chain),
-                doc=textwrap.fill(
-                    f"HSC RC2 processing with weekly {weekly} on ticket {ticket}, "
-                    "(converted from Gen2 repo at /datasets/hsc/repo).",
-                ),
+                doc=_RC2_RERUN_CHAIN_DOC.format(weekly=weekly, ticket=ticket),
                 flatten=True,
             )
         yield common.Group(f"HSC-rerun-RC2-{weekly}", generate())
@@ -33,14 +33,12 @@ __all__ = ()
 from pathlib import Path
 from typing import Iterator, TYPE_CHECKING
 
-from ..._repo_definition import RepoDefinition
 from ... import calibs
 from ... import common
 from ... import ingest
 from ... import doc_templates
 from ... import refcats
 from ... import visits
-from ._site import NCSA
 from . import hsc
 from . import decam
 
@@ -48,12 +46,6 @@ if TYPE_CHECKING:
     from ._operation import AdminOperation
 
 
-def repos() -> Iterator[RepoDefinition]:
-    """Generate the definitions for the `/repo/main` data repository at NCSA.
-    """
-    yield RepoDefinition(name="main", date="20210215", site=NCSA, operations=operations)
-
-
 def operations() -> Iterator[AdminOperation]:
     """Generate all operations used to set up the `/repo/main` data repository
     at NCSA.
@@ -30,21 +30,12 @@ __all__ = ()
 
 from typing import Iterator, TYPE_CHECKING
 
-from ..._repo_definition import RepoDefinition
 from ... import common
-from ._site import NCSA
 
 if TYPE_CHECKING:
     from ._operation import AdminOperation
 
 
-def repos() -> Iterator[RepoDefinition]:
-    """Generate the definitions for the `/repo/teststand` data repository at
-    NCSA.
-    """
-    yield RepoDefinition(name="teststand", date="20210215", site=NCSA, operations=operations)
-
-
 def operations() -> Iterator[AdminOperation]:
     """Generate all operations used to set up the `/repo/teststand` data
     repository at NCSA.
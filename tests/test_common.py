@@ -0,0 +1,139 @@
+# This file is part of gen3_shared_repo_admin.
+#
+# Developed for the LSST Data Management System.
+# This product includes software developed by the LSST Project
+# (https://www.lsst.org).
+# See the COPYRIGHT file at the top-level directory of this distribution
+# for details of code ownership.
+#
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <https://www.gnu.org/licenses/>.
+
+import logging
+import unittest
+from types import SimpleNamespace
+
+from lsst.daf.butler import CollectionType
+
+from lsst.gen3_shared_repo_admin.common import DefineTag, _chunks
+
+
+class _Ref(SimpleNamespace):
+    """Minimal stand-in for `DatasetRef`; `DefineTag` only looks at ``id``.
+    """
+
+
+class _Registry:
+    """Minimal stand-in for `Registry` that records what `DefineTag.run` does.
+    """
+
+    def __init__(self, results):
+        self.results = results
+        self.registered = []
+        self.associated = []
+        self.docs = {}
+
+    def queryDatasets(self, name, **kwargs):
+        return iter(self.results[name])
+
+    def registerCollection(self, name, type):
+        self.registered.append((name, type))
+
+    def associate(self, name, refs):
+        self.associated.append((name, list(refs)))
+
+    def setCollectionDocumentation(self, name, doc):
+        self.docs[name] = doc
+
+
+class _Progress:
+
+    def wrap(self, iterable, desc=None):
+        return iterable
+
+
+def _make_tool(registry, dry_run=False):
+    return SimpleNamespace(
+        butler=SimpleNamespace(registry=registry),
+        progress=_Progress(),
+        log=logging.getLogger("test_common"),
+        dry_run=dry_run,
+    )
+
+
+class ChunksTestCase(unittest.TestCase):
+    """Tests for `common._chunks`.
+    """
+
+    def testExactMultiple(self):
+        self.assertEqual(list(_chunks(range(6), 3)), [[0, 1, 2], [3, 4, 5]])
+
+    def testRemainder(self):
+        self.assertEqual(list(_chunks(range(7), 3)), [[0, 1, 2], [3, 4, 5], [6]])
+
+    def testEmpty(self):
+        self.assertEqual(list(_chunks([], 3)), [])
+
+    def testLazy(self):
+        consumed = []
+
+        def gen():
+            for i in range(10):
+                consumed.append(i)
+                yield i
+
+        chunks = _chunks(gen(), 4)
+        self.assertEqual(next(chunks), [0, 1, 2, 3])
+        self.assertEqual(consumed, [0, 1, 2, 3])
+
+
+class DefineTagTestCase(unittest.TestCase):
+    """Tests for `common.DefineTag.run`.
+    """
+
+    def setUp(self):
+        a, b, c, d = (_Ref(id=i) for i in range(4))
+        # Overlapping query results, including a duplicate within a single
+        # query and one that lands in a different chunk from its first
+        # appearance.
+        self.results = {"first": [a, b, a, c], "second": [c, d, b]}
+        self.expected = [a, b, c, d]
+
+    def _run(self, chunk_size, dry_run=False):
+        registry = _Registry(self.results)
+        op = DefineTag(
+            "tag-test", "tagged", [(("first",), {}), (("second",), {})], doc="test doc"
+        )
+        op.ASSOCIATE_N_DATASETS = chunk_size
+        op.run(_make_tool(registry, dry_run=dry_run))
+        return registry
+
+    def testDedupMatchesUnchunked(self):
+        for chunk_size in (1, 2, 3, 100):
+            with self.subTest(chunk_size=chunk_size):
+                registry = self._run(chunk_size)
+                associated = [ref for _, refs in registry.associated for ref in refs]
+                self.assertEqual(associated, self.expected)
+                self.assertTrue(all(len(refs) <= chunk_size for _, refs in registry.associated))
+                self.assertEqual(registry.registered, [("tagged", CollectionType.TAGGED)])
+                self.assertEqual(registry.docs, {"tagged": "test doc"})
+
+    def testDryRun(self):
+        registry = self._run(2, dry_run=True)
+        self.assertEqual(registry.associated, [])
+        self.assertEqual(registry.registered, [])
+        self.assertEqual(registry.docs, {})
+
+
+if __name__ == "__main__":
+    unittest.main()